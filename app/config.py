@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     
     # Weboldal
     base_url: str = "http://localhost:8000"
+    debug: bool = False  # Template-ek automatikus újratöltése (fejlesztéshez)
     
     # Email
     email_from: str = "noreply@example.com"
@@ -57,6 +58,9 @@ class Settings(BaseSettings):
     backup_max_per_server: int = 20  # Maximum backup száma szerverenként
     backup_max_total_size_gb: int = 20  # Maximum összes backup méret GB-ban
     
+    # Lapozás
+    tickets_page_size: int = 50  # Ticket listák alapértelmezett oldalmérete (felhasználói és admin)
+    
     # Exchange rate
     default_huf_eur_rate: float = 400.0  # Alapértelmezett HUF/EUR árfolyam (ha az API nem elérhető)
     
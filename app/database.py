@@ -2,7 +2,7 @@
 Adatbázis kapcsolat és modell
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Enum, Text, ForeignKey, JSON, TypeDecorator, UniqueConstraint
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Enum, Text, ForeignKey, JSON, TypeDecorator, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.sql import func
@@ -143,6 +143,11 @@ class Token(Base):
     # Relationships
     user = relationship("User", foreign_keys=[user_id], back_populates="tokens")
     generated_by = relationship("User", foreign_keys=[generated_by_id], back_populates="generated_tokens")
+    
+    # Összetett index: felhasználó tokenjei létrehozás szerint rendezve (legrégebbi szabad token keresése)
+    __table_args__ = (
+        Index('ix_tokens_user_id_created', 'user_id', 'created_at'),
+    )
 
 class Notification(Base):
     __tablename__ = "notifications"
@@ -223,6 +228,11 @@ class Ticket(Base):
     closed_by = relationship("User", foreign_keys=[closed_by_id])
     messages = relationship("TicketMessage", back_populates="ticket", order_by="TicketMessage.created_at")
     rating = relationship("TicketRating", back_populates="ticket", uselist=False)
+    
+    # Összetett index: felhasználó ticketjei létrehozás szerint rendezve (list_tickets)
+    __table_args__ = (
+        Index('ix_ticket_user_created', 'user_id', 'created_at'),
+    )
 
 class TicketMessage(Base):
     __tablename__ = "ticket_messages"
@@ -341,6 +351,22 @@ class ServerInstance(Base):
     token_used = relationship("Token", foreign_keys=[token_used_id])
     cluster = relationship("Cluster", back_populates="servers")
     ram_purchases = relationship("RamPurchase", back_populates="server")
+    
+    def token_expired(self, now: datetime) -> bool:
+        """Lejárt-e a szerverhez használt token"""
+        return bool(self.token_used_id and self.token_expires_at and self.token_expires_at <= now)
+    
+    def token_days_left(self, now: datetime):
+        """Token lejáratáig hátralévő napok (None, ha nincs token vagy már lejárt)"""
+        if self.token_used_id and self.token_expires_at and self.token_expires_at > now:
+            return (self.token_expires_at - now).days
+        return None
+    
+    def deletion_days_left(self, now: datetime):
+        """Ütemezett törlésig hátralévő napok lejárt token esetén (None, ha nincs ütemezve)"""
+        if not self.token_expired(now) or not self.scheduled_deletion_date:
+            return None
+        return max((self.scheduled_deletion_date - now).days, 0)
 
 class ArkServerFiles(Base):
     """Ark Survival Ascended szerverfájlok (Manager Admin telepíti)"""
@@ -450,6 +476,10 @@ class CartItem(Base):
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
     token = relationship("Token", foreign_keys=[token_id])
+    
+    __table_args__ = (
+        Index('ix_cartitem_user_type_token', 'user_id', 'item_type', 'token_id'),
+    )
 
 class TokenPricingRule(Base):
     """Token árazási szabályok"""
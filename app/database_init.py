@@ -143,6 +143,20 @@ def init_db():
                             if "Duplicate key name" not in str(e):
                                 print(f"  Figyelmeztetés: Index hozzáadása: {e}")
                 print("✓ generated_by_id oszlop hozzáadva")
+            
+            # Összetett index: felhasználó tokenjei létrehozás szerint rendezve
+            if 'ix_tokens_user_id_created' not in indexes:
+                print("ix_tokens_user_id_created index hozzáadása a tokens táblához...")
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(text("""
+                            ALTER TABLE tokens 
+                            ADD INDEX ix_tokens_user_id_created (user_id, created_at)
+                        """))
+                        conn.commit()
+                    print("✓ ix_tokens_user_id_created index hozzáadva")
+                except Exception as e:
+                    print(f"  Figyelmeztetés: ix_tokens_user_id_created index: {e}")
         
         # Új táblák létrehozása (tickets, chat stb.) - külön kezelés foreign key problémák miatt
         # Frissítjük a létező táblák listáját
@@ -199,7 +213,8 @@ def init_db():
                             PRIMARY KEY (id),
                             INDEX ix_tickets_user_id (user_id),
                             INDEX ix_tickets_status (status),
-                            INDEX ix_tickets_created_at (created_at)
+                            INDEX ix_tickets_created_at (created_at),
+                            INDEX ix_ticket_user_created (user_id, created_at)
                         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
                     """))
                     conn.commit()
@@ -242,6 +257,21 @@ def init_db():
                 traceback.print_exc()
         else:
             print("✓ tickets tábla már létezik")
+            
+            # Összetett index hozzáadása, ha hiányzik (list_tickets rendezett lekérdezéséhez)
+            ticket_indexes = [idx['name'] for idx in inspector.get_indexes('tickets')]
+            if 'ix_ticket_user_created' not in ticket_indexes:
+                print("ix_ticket_user_created index hozzáadása a tickets táblához...")
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(text("""
+                            ALTER TABLE tickets 
+                            ADD INDEX ix_ticket_user_created (user_id, created_at)
+                        """))
+                        conn.commit()
+                    print("✓ ix_ticket_user_created index hozzáadva")
+                except Exception as e:
+                    print(f"  Figyelmeztetés: ix_ticket_user_created index: {e}")
         
         # Frissítjük a létező táblák listáját
         existing_tables = inspector.get_table_names()
@@ -662,6 +692,7 @@ def init_db():
                             INDEX ix_cart_items_item_type (item_type),
                             INDEX ix_cart_items_token_id (token_id),
                             INDEX ix_cart_items_created_at (created_at),
+                            INDEX ix_cartitem_user_type_token (user_id, item_type, token_id),
                             CONSTRAINT fk_cart_items_user_id
                                 FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
                             CONSTRAINT fk_cart_items_token_id
@@ -704,6 +735,21 @@ def init_db():
                     print("✓ period_months oszlop hozzáadva")
                 except Exception as e:
                     print(f"  Figyelmeztetés: period_months oszlop: {e}")
+            
+            # Összetett index a kosár duplikáció ellenőrzéshez (user_id, item_type, token_id)
+            cart_indexes = [idx['name'] for idx in inspector.get_indexes('cart_items')]
+            if 'ix_cartitem_user_type_token' not in cart_indexes:
+                print("ix_cartitem_user_type_token index hozzáadása a cart_items táblához...")
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(text("""
+                            ALTER TABLE cart_items 
+                            ADD INDEX ix_cartitem_user_type_token (user_id, item_type, token_id)
+                        """))
+                        conn.commit()
+                    print("✓ ix_cartitem_user_type_token index hozzáadva")
+                except Exception as e:
+                    print(f"  Figyelmeztetés: ix_cartitem_user_type_token index: {e}")
         
         # Token requests tábla létrehozása
         existing_tables = inspector.get_table_names()
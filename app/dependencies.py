@@ -2,15 +2,63 @@
 FastAPI dependencies
 """
 
+import threading
+import time
+from types import SimpleNamespace
+from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 from jose import JWTError, jwt
 from app.database import get_db, User, UserRole
 from app.config import settings
 
 security = HTTPBearer()
 
+# Session felhasználó gyorsítótár: user_id -> (betöltés ideje, leválasztott User másolat)
+SESSION_USER_TTL = 30  # másodperc
+SESSION_USER_CACHE_MAX = 10_000
+_session_user_cache = {}
+_session_user_lock = threading.Lock()
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+def invalidate_session_user(user_id: int) -> None:
+    """Felhasználó törlése a session gyorsítótárból (profil, jelszó vagy szerepkör változásakor)"""
+    with _session_user_lock:
+        _session_user_cache.pop(user_id, None)
+
+def load_session_user(user_id: int, db: Session) -> Optional[User]:
+    """
+    Felhasználó betöltése user_id alapján, rövid TTL-es gyorsítótárral.
+    Találat esetén a másolat SELECT nélkül kerül be az aktuális session-be.
+    """
+    now = time.monotonic()
+    with _session_user_lock:
+        cached = _session_user_cache.get(user_id)
+    if cached and now - cached[0] < SESSION_USER_TTL:
+        return db.merge(cached[1], load=False)
+    
+    user = db.get(User, user_id)
+    if user is None:
+        invalidate_session_user(user_id)
+        return None
+    
+    snapshot = User(**{key: getattr(user, key) for key in _USER_COLUMNS})
+    make_transient_to_detached(snapshot)
+    with _session_user_lock:
+        if len(_session_user_cache) >= SESSION_USER_CACHE_MAX:
+            _session_user_cache.pop(next(iter(_session_user_cache)))
+        _session_user_cache[user_id] = (now, snapshot)
+    return user
+
+def get_session_user(request: Request, db: Session = Depends(get_db)) -> Optional[User]:
+    """Bejelentkezett felhasználó session alapján (None, ha nincs bejelentkezve)"""
+    user_id = request.session.get("user_id")
+    if not user_id:
+        return None
+    return load_session_user(user_id, db)
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -31,7 +79,7 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise credentials_exception
     
@@ -80,7 +128,7 @@ def require_manager_admin(request: Request, db: Session = Depends(get_db)) -> Us
             headers={"Location": "/login"}
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_session_user(user_id, db)
     if not user or user.role != UserRole.MANAGER_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -88,5 +136,38 @@ def require_manager_admin(request: Request, db: Session = Depends(get_db)) -> Us
         )
     return user
 
+def require_manager_admin_session(request: Request, db: Session = Depends(get_db)):
+    """
+    Manager Admin jogosultság ellenőrzése a gyorsítótárazott session felhasználó alapján.
+    Csak id-t és role-t ad vissza; ahol a teljes User kell, ott require_manager_admin-t használj.
+    """
+    user_id = request.session.get("user_id")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_302_FOUND,
+            detail="Nincs bejelentkezve",
+            headers={"Location": "/login"}
+        )
+    
+    denied = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Nincs jogosultságod - Manager Admin szükséges"
+    )
+    
+    # A session-ben tárolt rang csak az elutasítást gyorsítja; a jogosultságot mindig a
+    # (gyorsítótárazott, törléskor/rangváltáskor invalidált) felhasználó alapján adjuk meg
+    if request.session.get("user_role") not in (None, UserRole.MANAGER_ADMIN.value):
+        raise denied
+    
+    user = load_session_user(user_id, db)
+    if not user:
+        raise denied
+    role = user.role.value
+    request.session["user_role"] = role
+    
+    if role != UserRole.MANAGER_ADMIN.value:
+        raise denied
+    return SimpleNamespace(id=user_id, role=UserRole(role))
+
 # Session alapú dependency (cookie-khoz) - nincs használva, a require_login közvetlenül session-t használ
 
@@ -4,7 +4,6 @@ ZedinArkManager - FastAPI fő alkalmazás
 
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from starlette.middleware.sessions import SessionMiddleware
@@ -12,12 +11,10 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from pathlib import Path
 from app.config import settings
 from app.middleware import catch_exceptions_middleware, session_role_refresh_middleware
+from app.templating import BASE_DIR, TEMPLATES
 import asyncio
 import logging
 
-# Projekt gyökér
-BASE_DIR = Path(__file__).parent.parent
-
 # FastAPI app
 app = FastAPI(
     title="ZedinArkManager",
@@ -53,11 +50,8 @@ static_dir = BASE_DIR / "static"
 if static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
-# Template-ek
-templates_dir = BASE_DIR / "templates"
-if not templates_dir.exists():
-    templates_dir.mkdir(exist_ok=True)
-templates = Jinja2Templates(directory=str(templates_dir))
+# Template-ek - a közös példány az app.templating modulban van (a routerek is onnan importálják)
+templates = TEMPLATES
 
 # Routers importálása
 from app.routers import auth, dashboard, tokens, admin, notifications, api, notifications_admin, update, system, settings, tickets, tickets_admin, chat, server_management, games_admin, servers, ai_chat, cart, cart_admin, pricing, ark_admin, ark_servers, ark_evolved_servers, ark_setup, mods, ark_serverfiles, ark_evolved_serverfiles, ark_config, ark_evolved_config, ark_backup, ark_evolved_backup
@@ -234,6 +228,9 @@ async def startup_event():
     asyncio.create_task(token_expiry_worker())
     logging.info("Token lejárat ellenőrzés elindítva")
     
+    from app.routers.system import ping_monitor_worker
+    asyncio.create_task(ping_monitor_worker())
+    
     # FONTOS: Végül ismét ellenőrizzük, hogy ne jöjjön létre root jogosultságokkal mappa
     # (valami más folyamat hozhatja létre a startup event után)
     try:
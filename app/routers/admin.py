@@ -13,6 +13,8 @@ from app.database import (
     ChatMessage, RamPurchase, TokenRequest, TokenExtensionRequest
 )
 from app.services.auth_service import create_user
+from app.dependencies import invalidate_session_user
+from app.services.token_service import invalidate_assignable_users
 from app.services.email_service import send_verification_email
 from app.database import Token, User
 import secrets
@@ -334,6 +336,8 @@ async def update_user_role(
     # Rang módosítás
     user.role = UserRole(role)
     db.commit()
+    invalidate_session_user(user.id)
+    invalidate_assignable_users()
     
     request.session["success"] = f"{user.username} rangja sikeresen frissítve {role}-re!"
     return RedirectResponse(url="/admin/users", status_code=302)
@@ -459,6 +463,8 @@ async def delete_user(
         username = user.username  # Elmentjük a nevet, mielőtt törölnénk
         db.delete(user)
         db.commit()
+        invalidate_session_user(user_id)
+        invalidate_assignable_users()
         
         # JSONResponse-t adunk vissza, hogy a frontend megfelelően kezelje
         return JSONResponse(
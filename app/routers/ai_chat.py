@@ -6,18 +6,12 @@ from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import JSONResponse, HTMLResponse
 from sqlalchemy.orm import Session
 from app.database import get_db, User
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
 import httpx
 import json
 import os
 
 router = APIRouter(prefix="/api/ai", tags=["ai_chat"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 def require_login(request: Request, db: Session = Depends(get_db)) -> User:
     """Bejelentkezés ellenőrzése"""
     user_id = request.session.get("user_id")
@@ -7,7 +7,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from sqlalchemy.orm import Session
 from app.database import get_db, User, ArkServerFiles
 from app.dependencies import require_manager_admin
-from fastapi.templating import Jinja2Templates
+from app.templating import TEMPLATES
 from pathlib import Path
 from datetime import datetime
 import shutil
@@ -15,10 +15,6 @@ import os
 
 router = APIRouter(prefix="/admin/ark", tags=["ark_admin"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 @router.get("/files", response_class=HTMLResponse)
 async def list_ark_files(
     request: Request,
@@ -29,7 +25,7 @@ async def list_ark_files(
     
     ark_files = db.query(ArkServerFiles).order_by(ArkServerFiles.installed_at.desc()).all()
     
-    return templates.TemplateResponse("admin/ark/files.html", {
+    return TEMPLATES.TemplateResponse("admin/ark/files.html", {
         "request": request,
         "current_user": current_user,
         "ark_files": ark_files
@@ -43,7 +39,7 @@ async def show_install_form(
     """Manager Admin: Ark szerverfájlok telepítési form"""
     current_user = require_manager_admin(request, db)
     
-    return templates.TemplateResponse("admin/ark/install.html", {
+    return TEMPLATES.TemplateResponse("admin/ark/install.html", {
         "request": request,
         "current_user": current_user
     })
@@ -10,17 +10,13 @@ from pathlib import Path
 from app.database import get_db, User, ServerInstance
 from app.services.ark_config_service import (
     parse_ini_file, save_ini_file, get_setting_description,
-    is_boolean_setting, get_server_config_files, get_setting_category
+    is_boolean_setting, get_server_config_files, get_categories_for
 )
 from app.services.symlink_service import get_servers_base_path
-from fastapi.templating import Jinja2Templates
+from app.templating import TEMPLATES
 
 router = APIRouter(prefix="/ark/servers", tags=["ark_config"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 def require_server_admin(request: Request, db: Session = Depends(get_db)) -> User:
     """Server Admin jogosultság ellenőrzése"""
     user_id = request.session.get("user_id")
@@ -106,6 +102,9 @@ async def show_config(
     
     # Beállítások formázása a template-hez - kategóriák szerint csoportosítva
     settings_by_category = {}
+    categories = get_categories_for(
+        (section, key) for section, items in config_data.items() for key in items
+    )
     for section, items in config_data.items():
         for key, value in items.items():
             # Kihagyjuk azokat a beállításokat, amik a szerver szerkesztés oldalon vannak
@@ -113,8 +112,8 @@ async def show_config(
                 continue
             
             is_bool = is_boolean_setting(section, key, value)
-            description = get_setting_description(section, key)
-            category = get_setting_category(section, key)
+            description = get_setting_description(section, key, config_file_name)
+            category = categories[(section, key)]
             
             # Debug információk
             if not description:
@@ -176,7 +175,7 @@ async def show_config(
         if cat not in sorted_categories:
             sorted_categories.append(cat)
     
-    return templates.TemplateResponse("ark/server_config.html", {
+    return TEMPLATES.TemplateResponse("ark/server_config.html", {
         "request": request,
         "current_user": current_user,
         "server": server,
@@ -346,7 +345,7 @@ async def show_raw_config(
             print(f"Hiba a fájl beolvasásakor: {e}")
             file_content = ""
     
-    return templates.TemplateResponse("ark/server_config_raw.html", {
+    return TEMPLATES.TemplateResponse("ark/server_config_raw.html", {
         "request": request,
         "current_user": current_user,
         "server": server,
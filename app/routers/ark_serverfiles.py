@@ -9,7 +9,7 @@ from sqlalchemy import desc, and_
 from app.database import get_db, User, UserServerFiles, SessionLocal, Game
 from app.services.ark_install_service import install_ark_server_files, delete_ark_server_files, check_for_updates
 from app.services.symlink_service import get_user_serverfiles_path
-from fastapi.templating import Jinja2Templates
+from app.templating import TEMPLATES
 from pathlib import Path
 from datetime import datetime
 import json
@@ -18,10 +18,6 @@ import uuid
 
 router = APIRouter(prefix="/ark/serverfiles", tags=["ark_serverfiles"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 # Aktív telepítések tárolása (session_id -> task)
 active_installations = {}
 
@@ -66,7 +62,7 @@ async def list_serverfiles(
         # A frissítés ellenőrzés kikapcsolva a listázásnál, mert túl hosszú
         # Külön endpoint-on lehet ellenőrizni: /ark/serverfiles/check-updates
     
-    return templates.TemplateResponse("ark/serverfiles/list.html", {
+    return TEMPLATES.TemplateResponse("ark/serverfiles/list.html", {
         "request": request,
         "current_user": current_user,
         "serverfiles": serverfiles,
@@ -86,7 +82,7 @@ async def show_install_form(
     # Ha update paraméter van, akkor automatikusan indítsuk a streamelést
     serverfiles_id = update
     
-    return templates.TemplateResponse("ark/serverfiles/install.html", {
+    return TEMPLATES.TemplateResponse("ark/serverfiles/install.html", {
         "request": request,
         "current_user": current_user,
         "serverfiles_id": serverfiles_id,
@@ -10,7 +10,7 @@ from app.database import get_db, User, Game, ServerInstance, ServerStatus, Token
 from app.services.port_service import find_available_port, get_query_port, get_rcon_port
 from app.services.symlink_service import create_server_symlink, remove_server_symlink, get_server_path
 from app.services.ark_config_service import update_config_from_server_settings
-from fastapi.templating import Jinja2Templates
+from app.templating import TEMPLATES
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
@@ -463,7 +463,7 @@ async def server_logs_page(
     except:
         pass
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "ark/server_logs.html",
         {
             "request": request,
@@ -475,10 +475,6 @@ async def server_logs_page(
         }
     )
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 def require_server_admin(request: Request, db: Session = Depends(get_db)) -> User:
     """Server Admin jogosultság ellenőrzése"""
     user_id = request.session.get("user_id")
@@ -515,7 +511,7 @@ async def list_clusters(
             ServerInstance.cluster_id == cluster.id
         ).count()
     
-    return templates.TemplateResponse("ark/clusters.html", {
+    return TEMPLATES.TemplateResponse("ark/clusters.html", {
         "request": request,
         "current_user": current_user,
         "clusters": clusters
@@ -529,7 +525,7 @@ async def show_create_cluster(
     """Server Admin: Cluster létrehozási form"""
     current_user = require_server_admin(request, db)
     
-    return templates.TemplateResponse("ark/cluster_create.html", {
+    return TEMPLATES.TemplateResponse("ark/cluster_create.html", {
         "request": request,
         "current_user": current_user
     })
@@ -664,7 +660,7 @@ async def show_create_server(
     
     available_tokens = active_tokens_count - used_tokens_count
     
-    return templates.TemplateResponse("ark/server_create.html", {
+    return TEMPLATES.TemplateResponse("ark/server_create.html", {
         "request": request,
         "current_user": current_user,
         "ark_game": ark_game,
@@ -1118,7 +1114,7 @@ async def list_servers(
         from app.database import RamPricing
         ram_pricing = db.query(RamPricing).order_by(RamPricing.updated_at.desc()).first()
     
-    return templates.TemplateResponse("ark/servers.html", {
+    return TEMPLATES.TemplateResponse("ark/servers.html", {
         "request": request,
         "current_user": current_user,
         "servers_data": servers_data,
@@ -1150,7 +1146,7 @@ async def show_edit_server(
         Cluster.server_admin_id == current_user.id
     ).order_by(Cluster.name).all()
     
-    return templates.TemplateResponse("ark/server_edit.html", {
+    return TEMPLATES.TemplateResponse("ark/server_edit.html", {
         "request": request,
         "current_user": current_user,
         "server": server,
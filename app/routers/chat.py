@@ -7,16 +7,11 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app.database import get_db, User, ChatRoom, ChatMessage
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from app.templating import TEMPLATES
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 @router.get("/chat", response_class=HTMLResponse)
 async def list_chat_rooms(request: Request, db: Session = Depends(get_db)):
     """Chat szobák listája"""
@@ -50,7 +45,7 @@ async def list_chat_rooms(request: Request, db: Session = Depends(get_db)):
             "last_message": last_message
         }
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "chat/rooms.html",
         {
             "request": request,
@@ -85,7 +80,7 @@ async def view_chat_room(request: Request, room_id: int, db: Session = Depends(g
     
     messages.reverse()  # Időrendi sorrend
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "chat/room.html",
         {
             "request": request,
@@ -8,15 +8,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app.database import get_db, User, Game
 from app.dependencies import require_manager_admin
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from app.templating import TEMPLATES
 
 router = APIRouter(prefix="/admin/games", tags=["games_admin"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 @router.get("", response_class=HTMLResponse)
 async def list_games(
     request: Request,
@@ -27,7 +22,7 @@ async def list_games(
     
     games = db.query(Game).order_by(desc(Game.created_at)).all()
     
-    return templates.TemplateResponse("admin/games/list.html", {
+    return TEMPLATES.TemplateResponse("admin/games/list.html", {
         "request": request,
         "current_user": current_user,
         "games": games
@@ -41,7 +36,7 @@ async def show_add_game(
     """Manager Admin: Játék hozzáadása form"""
     current_user = require_manager_admin(request, db)
     
-    return templates.TemplateResponse("admin/games/add.html", {
+    return TEMPLATES.TemplateResponse("admin/games/add.html", {
         "request": request,
         "current_user": current_user
     })
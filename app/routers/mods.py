@@ -7,15 +7,10 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_
 from app.database import get_db, User, UserMod
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from app.templating import TEMPLATES
 
 router = APIRouter(prefix="/mods", tags=["mods"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 def require_server_admin(request: Request, db: Session = Depends(get_db)) -> User:
     """Server Admin jogosultság ellenőrzése"""
     user_id = request.session.get("user_id")
@@ -46,7 +41,7 @@ async def list_mods(
         UserMod.user_id == current_user.id
     ).order_by(desc(UserMod.created_at)).all()
     
-    return templates.TemplateResponse("mods/list.html", {
+    return TEMPLATES.TemplateResponse("mods/list.html", {
         "request": request,
         "current_user": current_user,
         "mods": mods
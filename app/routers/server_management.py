@@ -4,40 +4,133 @@ Server Management router - Manager Admin szerverkezelés
 
 from fastapi import APIRouter, Request, HTTPException, Depends, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
-from sqlalchemy.orm import Session
-from app.database import get_db, User
+from app.database import User
 from app.dependencies import require_manager_admin
-from fastapi.templating import Jinja2Templates
+from app.templating import TEMPLATES
 from pathlib import Path
 import subprocess
+import asyncio
 import os
 import json
-import threading
-import queue
 import time
+from collections import deque
+from itertools import islice
 
 router = APIRouter(prefix="/admin/server", tags=["server_management"])
 
-# Template-ek inicializálása
 BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
 # SteamCMD mappa
 STEAMCMD_DIR = BASE_DIR / "Server" / "SteamCMD"
 STEAMCMD_BIN = STEAMCMD_DIR / "steamcmd.sh" if os.name != 'nt' else STEAMCMD_DIR / "steamcmd.exe"
 
-# Folyamatok tárolása (process_id -> process)
+# Folyamatok tárolása (process_id -> {"task": asyncio.Task, "proc": aktuális gyermek folyamat})
 active_processes = {}
-process_outputs = {}  # process_id -> queue
+process_outputs = {}  # process_id -> {"history", "total", "event", "done", "finished_at"}
+
+# A befejezett folyamatok kimenete legfeljebb ennyi ideig / ennyi darabig marad meg (újracsatlakozáshoz)
+PROCESS_OUTPUT_TTL = 300  # másodperc
+PROCESS_OUTPUT_MAX = 64
+PROCESS_OUTPUT_HISTORY = 2048  # sor / folyamat
+
+# Folyamat vége jelző a kimenet végén (azonosság alapján ellenőrizzük, nem a szöveg tartalma alapján)
+_DONE = object()
+
+# WebSocket lezárási kódok a kliens felé (a vége jelzés nem a kimenet szövegében megy)
+WS_CLOSE_DONE = 4000  # A folyamat befejeződött, a teljes kimenet elküldve
+WS_CLOSE_NOT_FOUND = 4004  # Nincs ilyen (vagy már lejárt) folyamat
+
+# Egyszerre legfeljebb ennyi SteamCMD telepítés/frissítés futhat
+STEAMCMD_MAX_CONCURRENT = 2
+_steamcmd_semaphore = asyncio.Semaphore(STEAMCMD_MAX_CONCURRENT)
+
+def _register_process_output(process_id: str) -> dict:
+    """Új kimenet bejegyzés létrehozása, a lejárt és a legrégebben befejezett bejegyzések takarításával"""
+    now = time.monotonic()
+    expired = [
+        pid for pid, entry in process_outputs.items()
+        if entry["done"] and now - entry["finished_at"] > PROCESS_OUTPUT_TTL
+    ]
+    for pid in expired:
+        del process_outputs[pid]
+    # Méretkorlát: csak befejezett bejegyzést dobunk el (a legrégebben befejezettet);
+    # futó folyamat kimenetét soha, inkább átlépjük a korlátot
+    excess = len(process_outputs) - PROCESS_OUTPUT_MAX + 1
+    if excess > 0:
+        finished = sorted(
+            (entry["finished_at"], pid) for pid, entry in process_outputs.items() if entry["done"]
+        )
+        for _, pid in finished[:excess]:
+            del process_outputs[pid]
+    
+    entry = {
+        "history": deque(maxlen=PROCESS_OUTPUT_HISTORY),
+        "total": 0,  # Eddig összesen hozzáadott sorok száma (a deque eleje elcsúszhat)
+        "event": asyncio.Event(),
+        "done": False,
+        "finished_at": None
+    }
+    process_outputs[process_id] = entry
+    return entry
+
+def _emit_output(entry: dict, line):
+    """Sor hozzáadása a kimenethez és a várakozó WebSocket-ek felébresztése"""
+    entry["history"].append(line)
+    entry["total"] += 1
+    # Minden várakozót felébresztünk, a következő várakozáshoz új Event kell
+    entry["event"].set()
+    entry["event"] = asyncio.Event()
+
+def _finish_output(entry: dict):
+    """Folyamat vége jelzése"""
+    _emit_output(entry, _DONE)
+    entry["done"] = True
+    entry["finished_at"] = time.monotonic()
+
+def _track_process(process_id: str, proc):
+    """Az éppen futó gyermek folyamat eltárolása, hogy megszakítható legyen"""
+    entry = active_processes.get(process_id)
+    if entry is not None:
+        entry["proc"] = proc
+    return proc
+
+async def _stop_process(proc):
+    """Gyermek folyamat leállítása: terminate, legfeljebb 5 mp várakozás, utána kill"""
+    if proc is None or proc.returncode is not None:
+        return
+    try:
+        proc.terminate()
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+async def _pipe_output(stream, output_entry, prefix=""):
+    """Folyamat kimenetének továbbítása - nyers byte-ok 4KB-os darabokban, darabonként egy dekódolással"""
+    leftover = b""
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            break
+        data = leftover + chunk
+        cut = data.rfind(b"\n") + 1
+        leftover = data[cut:]
+        if cut:
+            for line in data[:cut].decode("utf-8", "replace").splitlines():
+                _emit_output(output_entry, f"{prefix}{line}\n")
+    if leftover:
+        for line in leftover.decode("utf-8", "replace").splitlines():
+            _emit_output(output_entry, f"{prefix}{line}\n")
 
 @router.get("/steamcmd", response_class=HTMLResponse)
 async def steamcmd_page(
     request: Request,
-    db: Session = Depends(get_db)
+    current_user: User = Depends(require_manager_admin)
 ):
     """SteamCMD kezelő oldal"""
-    current_user = require_manager_admin(request, db)
-    
     # Ellenőrizzük, hogy a SteamCMD telepítve van-e
     is_installed = STEAMCMD_BIN.exists() if STEAMCMD_BIN else False
     steamcmd_version = None
@@ -59,7 +152,7 @@ async def steamcmd_page(
         except:
             pass
     
-    return templates.TemplateResponse("admin/server/steamcmd.html", {
+    return TEMPLATES.TemplateResponse("admin/server/steamcmd.html", {
         "request": request,
         "current_user": current_user,
         "is_installed": is_installed,
@@ -70,11 +163,9 @@ async def steamcmd_page(
 @router.post("/steamcmd/install")
 async def install_steamcmd(
     request: Request,
-    db: Session = Depends(get_db)
+    current_user: User = Depends(require_manager_admin)
 ):
     """SteamCMD telepítése"""
-    current_user = require_manager_admin(request, db)
-    
     # Ellenőrizzük, hogy már telepítve van-e
     if STEAMCMD_BIN.exists():
         return JSONResponse({
@@ -87,114 +178,106 @@ async def install_steamcmd(
     process_id = str(uuid.uuid4())
     
     # Output queue létrehozása
-    output_queue = queue.Queue()
-    process_outputs[process_id] = output_queue
+    output_entry = _register_process_output(process_id)
     
-    def install_process():
+    async def install_process():
         """SteamCMD telepítő folyamat"""
         try:
-            # Mappa létrehozása
-            output_queue.put("[INFO] SteamCMD mappa létrehozása...\n")
-            STEAMCMD_DIR.mkdir(parents=True, exist_ok=True)
-            output_queue.put(f"[INFO] Mappa: {STEAMCMD_DIR}\n")
-            
-            # Linux/Unix rendszerek
-            if os.name != 'nt':
-                output_queue.put("[INFO] Linux/Unix rendszer észlelve\n")
+            if _steamcmd_semaphore.locked():
+                _emit_output(output_entry, "[INFO] Sorban áll, várakozás szabad helyre...\n")
+            async with _steamcmd_semaphore:
+                # Mappa létrehozása
+                _emit_output(output_entry, "[INFO] SteamCMD mappa létrehozása...\n")
+                STEAMCMD_DIR.mkdir(parents=True, exist_ok=True)
+                _emit_output(output_entry, f"[INFO] Mappa: {STEAMCMD_DIR}\n")
                 
-                # SteamCMD letöltése
-                output_queue.put("[INFO] SteamCMD letöltése...\n")
-                download_cmd = "curl -sqL 'https://steamcdn-a.akamaihd.net/client/installer/steamcmd_linux.tar.gz' -o steamcmd.tar.gz"
-                download_process = subprocess.Popen(
-                    download_cmd,
-                    shell=True,
-                    cwd=str(STEAMCMD_DIR),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
-                
-                # Live output olvasása
-                for line in download_process.stdout:
-                    output_queue.put(f"[DOWNLOAD] {line}")
-                download_process.wait()
-                
-                if download_process.returncode != 0:
-                    output_queue.put("[ERROR] Letöltés sikertelen!\n")
-                    return
-                
-                output_queue.put("[INFO] Letöltés befejezve\n")
-                output_queue.put("[INFO] Fájlok kicsomagolása...\n")
-                
-                # Kicsomagolás
-                extract_process = subprocess.Popen(
-                    "tar zxvf steamcmd.tar.gz",
-                    shell=True,
-                    cwd=str(STEAMCMD_DIR),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
-                
-                for line in extract_process.stdout:
-                    output_queue.put(f"[EXTRACT] {line}")
-                extract_process.wait()
-                
-                if extract_process.returncode != 0:
-                    output_queue.put("[ERROR] Kicsomagolás sikertelen!\n")
+                # Linux/Unix rendszerek
+                if os.name != 'nt':
+                    _emit_output(output_entry, "[INFO] Linux/Unix rendszer észlelve\n")
+                    
+                    # SteamCMD letöltése
+                    _emit_output(output_entry, "[INFO] SteamCMD letöltése...\n")
+                    download_process = _track_process(process_id, await asyncio.create_subprocess_exec(
+                        "curl", "-sqL",
+                        "https://steamcdn-a.akamaihd.net/client/installer/steamcmd_linux.tar.gz",
+                        "-o", "steamcmd.tar.gz",
+                        cwd=str(STEAMCMD_DIR),
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.STDOUT
+                    ))
+                    
+                    # Live output olvasása
+                    await _pipe_output(download_process.stdout, output_entry, "[DOWNLOAD] ")
+                    await download_process.wait()
+                    
+                    if download_process.returncode != 0:
+                        _emit_output(output_entry, "[ERROR] Letöltés sikertelen!\n")
+                        return
+                    
+                    _emit_output(output_entry, "[INFO] Letöltés befejezve\n")
+                    _emit_output(output_entry, "[INFO] Fájlok kicsomagolása...\n")
+                    
+                    # Kicsomagolás
+                    extract_process = _track_process(process_id, await asyncio.create_subprocess_exec(
+                        "tar", "zxvf", "steamcmd.tar.gz",
+                        cwd=str(STEAMCMD_DIR),
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.STDOUT
+                    ))
+                    
+                    await _pipe_output(extract_process.stdout, output_entry, "[EXTRACT] ")
+                    await extract_process.wait()
+                    
+                    if extract_process.returncode != 0:
+                        _emit_output(output_entry, "[ERROR] Kicsomagolás sikertelen!\n")
+                        return
+                    
+                    _emit_output(output_entry, "[INFO] Jogosultságok beállítása...\n")
+                    
+                    # Jogosultságok beállítása
+                    chmod_process = _track_process(process_id, await asyncio.create_subprocess_exec(
+                        "chmod", "+x", "steamcmd.sh",
+                        cwd=str(STEAMCMD_DIR),
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    ))
+                    _, chmod_stderr = await chmod_process.communicate()
+                    
+                    if chmod_process.returncode != 0:
+                        _emit_output(output_entry, f"[WARNING] Jogosultság beállítás: {chmod_stderr.decode('utf-8', 'replace')}\n")
+                    else:
+                        _emit_output(output_entry, "[INFO] Jogosultságok beállítva\n")
+                else:
+                    # Windows rendszerek
+                    steamcmd_url = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
+                    _emit_output(output_entry, f"[INFO] SteamCMD letöltése Windows rendszerre...\n")
+                    _emit_output(output_entry, "[ERROR] Windows telepítés még nincs implementálva\n")
                     return
                 
-                output_queue.put("[INFO] Jogosultságok beállítása...\n")
-                
-                # Jogosultságok beállítása
-                chmod_process = subprocess.run(
-                    "chmod +x steamcmd.sh",
-                    shell=True,
-                    cwd=str(STEAMCMD_DIR),
-                    capture_output=True,
-                    text=True
-                )
-                
-                if chmod_process.returncode != 0:
-                    output_queue.put(f"[WARNING] Jogosultság beállítás: {chmod_process.stderr}\n")
+                # Ellenőrzés
+                _emit_output(output_entry, "[INFO] Telepítés ellenőrzése...\n")
+                if STEAMCMD_BIN.exists():
+                    _emit_output(output_entry, "[SUCCESS] ✓ SteamCMD telepítése sikeres!\n")
+                    _emit_output(output_entry, f"[INFO] Telepítési útvonal: {STEAMCMD_BIN}\n")
                 else:
-                    output_queue.put("[INFO] Jogosultságok beállítva\n")
-            else:
-                # Windows rendszerek
-                steamcmd_url = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
-                output_queue.put(f"[INFO] SteamCMD letöltése Windows rendszerre...\n")
-                output_queue.put("[ERROR] Windows telepítés még nincs implementálva\n")
-                return
-            
-            # Ellenőrzés
-            output_queue.put("[INFO] Telepítés ellenőrzése...\n")
-            if STEAMCMD_BIN.exists():
-                output_queue.put("[SUCCESS] ✓ SteamCMD telepítése sikeres!\n")
-                output_queue.put(f"[INFO] Telepítési útvonal: {STEAMCMD_BIN}\n")
-            else:
-                output_queue.put("[ERROR] ✗ SteamCMD telepítése sikertelen! A fájl nem található.\n")
+                    _emit_output(output_entry, "[ERROR] ✗ SteamCMD telepítése sikertelen! A fájl nem található.\n")
+        except asyncio.CancelledError:
+            _emit_output(output_entry, "[WARNING] Folyamat megszakítva\n")
+            raise
         except Exception as e:
-            output_queue.put(f"[ERROR] Hiba: {str(e)}\n")
+            _emit_output(output_entry, f"[ERROR] Hiba: {str(e)}\n")
             import traceback
-            output_queue.put(f"[ERROR] Traceback: {traceback.format_exc()}\n")
+            _emit_output(output_entry, f"[ERROR] Traceback: {traceback.format_exc()}\n")
         finally:
-            output_queue.put("[DONE]\n")
-            # Várunk egy kicsit, hogy a WebSocket végig tudja olvasni az üzeneteket
-            time.sleep(2)
-            if process_id in active_processes:
-                del active_processes[process_id]
-            # Ne töröljük azonnal a process_outputs-ot, hogy a WebSocket végig tudja olvasni
-            # A WebSocket törli, amikor befejeződik
+            entry = active_processes.pop(process_id, None)
+            if entry is not None:
+                await _stop_process(entry["proc"])
+            _finish_output(output_entry)
+            # A process_outputs megmarad a TTL lejártáig, hogy újracsatlakozáskor visszajátszható legyen
     
     # Folyamat indítása háttérben
-    thread = threading.Thread(target=install_process)
-    thread.daemon = True
-    thread.start()
-    active_processes[process_id] = thread
+    task = asyncio.create_task(install_process())
+    active_processes[process_id] = {"task": task, "proc": None}
     
     return JSONResponse({
         "success": True,
@@ -205,11 +288,9 @@ async def install_steamcmd(
 @router.post("/steamcmd/update")
 async def update_steamcmd(
     request: Request,
-    db: Session = Depends(get_db)
+    current_user: User = Depends(require_manager_admin)
 ):
     """SteamCMD frissítése"""
-    current_user = require_manager_admin(request, db)
-    
     # Ellenőrizzük, hogy telepítve van-e
     if not STEAMCMD_BIN.exists():
         return JSONResponse({
@@ -222,60 +303,50 @@ async def update_steamcmd(
     process_id = str(uuid.uuid4())
     
     # Output queue létrehozása
-    output_queue = queue.Queue()
-    process_outputs[process_id] = output_queue
+    output_entry = _register_process_output(process_id)
     
-    def update_process():
+    async def update_process():
         """SteamCMD frissítő folyamat"""
         try:
-            output_queue.put("[INFO] SteamCMD frissítése elindítva...\n")
-            output_queue.put(f"[INFO] Futtatás: {STEAMCMD_BIN} +quit\n")
-            
-            # SteamCMD frissítése
-            process = subprocess.Popen(
-                [str(STEAMCMD_BIN), "+quit"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                cwd=str(STEAMCMD_DIR)
-            )
-            
-            # Live output olvasása soronként
-            while True:
-                line = process.stdout.readline()
-                if not line:
-                    break
-                output_queue.put(line)
-                # Flush a buffer miatt
-                import sys
-                sys.stdout.flush()
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                output_queue.put("[SUCCESS] ✓ SteamCMD frissítése sikeres!\n")
-            else:
-                output_queue.put(f"[ERROR] ✗ SteamCMD frissítése sikertelen (exit code: {process.returncode})\n")
+            if _steamcmd_semaphore.locked():
+                _emit_output(output_entry, "[INFO] Sorban áll, várakozás szabad helyre...\n")
+            async with _steamcmd_semaphore:
+                _emit_output(output_entry, "[INFO] SteamCMD frissítése elindítva...\n")
+                _emit_output(output_entry, f"[INFO] Futtatás: {STEAMCMD_BIN} +quit\n")
+                
+                # SteamCMD frissítése
+                process = _track_process(process_id, await asyncio.create_subprocess_exec(
+                    str(STEAMCMD_BIN), "+quit",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                    cwd=str(STEAMCMD_DIR)
+                ))
+                
+                # Live output olvasása
+                await _pipe_output(process.stdout, output_entry)
+                await process.wait()
+                
+                if process.returncode == 0:
+                    _emit_output(output_entry, "[SUCCESS] ✓ SteamCMD frissítése sikeres!\n")
+                else:
+                    _emit_output(output_entry, f"[ERROR] ✗ SteamCMD frissítése sikertelen (exit code: {process.returncode})\n")
+        except asyncio.CancelledError:
+            _emit_output(output_entry, "[WARNING] Folyamat megszakítva\n")
+            raise
         except Exception as e:
-            output_queue.put(f"[ERROR] Hiba: {str(e)}\n")
+            _emit_output(output_entry, f"[ERROR] Hiba: {str(e)}\n")
             import traceback
-            output_queue.put(f"[ERROR] Traceback: {traceback.format_exc()}\n")
+            _emit_output(output_entry, f"[ERROR] Traceback: {traceback.format_exc()}\n")
         finally:
-            output_queue.put("[DONE]\n")
-            # Várunk egy kicsit, hogy a WebSocket végig tudja olvasni az üzeneteket
-            time.sleep(2)
-            if process_id in active_processes:
-                del active_processes[process_id]
-            # Ne töröljük azonnal a process_outputs-ot, hogy a WebSocket végig tudja olvasni
-            # A WebSocket törli, amikor befejeződik
+            entry = active_processes.pop(process_id, None)
+            if entry is not None:
+                await _stop_process(entry["proc"])
+            _finish_output(output_entry)
+            # A process_outputs megmarad a TTL lejártáig, hogy újracsatlakozáskor visszajátszható legyen
     
     # Folyamat indítása háttérben
-    thread = threading.Thread(target=update_process)
-    thread.daemon = True
-    thread.start()
-    active_processes[process_id] = thread
+    task = asyncio.create_task(update_process())
+    active_processes[process_id] = {"task": task, "proc": None}
     
     return JSONResponse({
         "success": True,
@@ -283,93 +354,81 @@ async def update_steamcmd(
         "message": "SteamCMD frissítése elindítva"
     })
 
+@router.post("/steamcmd/{process_id}/cancel")
+async def cancel_steamcmd(
+    request: Request,
+    process_id: str,
+    current_user: User = Depends(require_manager_admin)
+):
+    """Futó SteamCMD telepítés/frissítés megszakítása"""
+    entry = active_processes.get(process_id)
+    if entry is None:
+        return JSONResponse({
+            "success": False,
+            "message": "A folyamat nem fut"
+        })
+    
+    proc = entry["proc"]
+    if proc is not None and proc.returncode is None:
+        try:
+            proc.terminate()
+        except ProcessLookupError:
+            pass
+    entry["task"].cancel()
+    
+    return JSONResponse({
+        "success": True,
+        "message": "Folyamat megszakítva"
+    })
+
 @router.websocket("/steamcmd/output/{process_id}")
 async def steamcmd_output(websocket: WebSocket, process_id: str):
-    """WebSocket végpont a live terminál kimenethez"""
+    """WebSocket végpont a live terminál kimenethez
+    
+    Csatlakozáskor (újracsatlakozáskor is) először a teljes eddigi kimenetet küldjük el,
+    utána az új sorokat kötegelve. A folyamat végét a WS_CLOSE_DONE lezárási kód jelzi.
+    """
     await websocket.accept()
     
+    output_entry = process_outputs.get(process_id)
+    if output_entry is None:
+        # Process nem található - már befejeződött vagy lejárt
+        await websocket.send_text("[INFO] Process befejeződött\n")
+        await websocket.close(code=WS_CLOSE_NOT_FOUND)
+        return
+    
+    sent = 0  # Eddig elküldött sorok száma (a "total" számlálóhoz viszonyítva)
     try:
-        done = False
-        empty_count = 0  # Számláló az üres iterációkhoz
-        max_empty_iterations = 50  # Maximum 5 másodperc várakozás (50 * 0.1s)
-        
-        while not done:
-            if process_id in process_outputs:
-                output_queue = process_outputs[process_id]
-                
-                # Összes elérhető üzenet küldése
-                messages_sent = False
-                while True:
-                    try:
-                        # Nem blokkoló get
-                        line = output_queue.get_nowait()
-                        await websocket.send_text(line)
-                        messages_sent = True
-                        empty_count = 0  # Reset számláló
-                        
-                        # Ha vége, várunk még egy kicsit, hogy minden üzenet kimenjen
-                        if "[DONE]" in line:
-                            # Várunk még egy kicsit, hátha van még output
-                            time.sleep(0.5)
-                            # Utolsó üzenetek küldése
-                            while True:
-                                try:
-                                    line = output_queue.get_nowait()
-                                    await websocket.send_text(line)
-                                except queue.Empty:
-                                    break
-                            done = True
-                            break
-                    except queue.Empty:
-                        break
-                
-                # Ha nem volt üzenet, várunk egy kicsit
-                if not messages_sent and not done:
-                    empty_count += 1
-                    if empty_count >= max_empty_iterations:
-                        # Ha túl sokáig nincs üzenet, ellenőrizzük, hogy a process még fut-e
-                        if process_id not in active_processes:
-                            # Process befejeződött, de lehet, hogy még vannak üzenetek
-                            time.sleep(0.5)
-                            # Utolsó üzenetek küldése
-                            while True:
-                                try:
-                                    line = output_queue.get_nowait()
-                                    await websocket.send_text(line)
-                                    if "[DONE]" in line:
-                                        done = True
-                                        break
-                                except queue.Empty:
-                                    break
-                            if not done:
-                                done = True
-                    await websocket.send_text("")  # Keep-alive
-                    time.sleep(0.1)
-            else:
-                # Process nem található - lehet, hogy már befejeződött
-                # Várunk egy kicsit, hátha még jön output
-                empty_count += 1
-                if empty_count >= max_empty_iterations:
-                    await websocket.send_text("[INFO] Process befejeződött\n")
-                    done = True
-                else:
-                    time.sleep(0.1)
-        
-        # Cleanup: töröljük a process_outputs-ot, ha még ott van
-        if process_id in process_outputs:
-            del process_outputs[process_id]
+        while True:
+            # Az Event-et a küldés előtt kérjük le, így a küldés közben érkező sorok sem vesznek el
+            event = output_entry["event"]
+            history = output_entry["history"]
+            total = output_entry["total"]
+            first = total - len(history)
+            start = max(sent, first)
+            finished = False
+            if start < total:
+                batch = list(islice(history, start - first, None))
+                sent = total
+                if batch[-1] is _DONE:
+                    batch.pop()
+                    finished = True
+                if batch:
+                    await websocket.send_text("".join(batch))
+            
+            if finished:
+                # Külön lezárási kóddal jelezzük a véget, így a kimenet szövege nem téveszthető össze vele
+                await websocket.close(code=WS_CLOSE_DONE)
+                break
             
+            try:
+                await asyncio.wait_for(event.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                await websocket.send_text("")  # Keep-alive
     except WebSocketDisconnect:
-        # Cleanup ha a kliens lecsatlakozik
-        if process_id in process_outputs:
-            del process_outputs[process_id]
         pass
     except Exception as e:
         try:
             await websocket.send_text(f"[ERROR] WebSocket hiba: {str(e)}\n")
         except:
             pass
-        # Cleanup hiba esetén is
-        if process_id in process_outputs:
-            del process_outputs[process_id]
-
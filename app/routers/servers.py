@@ -4,20 +4,16 @@ Servers router - Server Admin szerver indítás
 
 from fastapi import APIRouter, Request, Form, HTTPException, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, asc
-from app.database import get_db, User, Game, ServerInstance, ServerStatus, Token, TokenType
-from app.dependencies import require_manager_admin
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
-from datetime import datetime
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, and_, asc, not_
+from app.database import get_db, User, UserRole, Game, ServerInstance, ServerStatus, Token, TokenType
+from app.dependencies import require_manager_admin, load_session_user
+from app.templating import TEMPLATES
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 router = APIRouter(prefix="/servers", tags=["servers"])
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 def require_server_admin(request: Request, db: Session = Depends(get_db)) -> User:
     """Server Admin jogosultság ellenőrzése"""
     user_id = request.session.get("user_id")
@@ -28,97 +24,85 @@ def require_server_admin(request: Request, db: Session = Depends(get_db)) -> Use
             headers={"Location": "/login"}
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user or user.role.value not in ["server_admin", "manager_admin"]:
-        raise HTTPException(
-            status_code=403,
-            detail="Nincs jogosultságod - Server Admin szükséges"
+    denied = HTTPException(
+        status_code=403,
+        detail="Nincs jogosultságod - Server Admin szükséges"
+    )
+    
+    # A session-ben tárolt rang csak az elutasítást gyorsítja; a jogosultságot a
+    # gyorsítótárazott (törléskor/rangváltáskor invalidált) felhasználó alapján adjuk meg
+    if request.session.get("user_role") not in (None, "server_admin", "manager_admin"):
+        raise denied
+    
+    user = load_session_user(user_id, db)
+    if not user:
+        raise denied
+    role = user.role.value
+    request.session["user_role"] = role
+    
+    if role not in ("server_admin", "manager_admin"):
+        raise denied
+    return SimpleNamespace(id=user_id, role=UserRole(role))
+
+def count_available_tokens(db: Session, user_id: int) -> int:
+    """Szabad aktív tokenek száma (aktív tokenek, amik NINCSENEK használatban szerverrel)"""
+    active_tokens_count = db.query(Token).filter(
+        and_(
+            Token.user_id == user_id,
+            Token.is_active == True,
+            Token.expires_at > datetime.now()
         )
-    return user
+    ).count()
+    
+    # Számoljuk, hogy hány szerver van aktív token-nel
+    used_tokens_count = db.query(ServerInstance).filter(
+        and_(
+            ServerInstance.server_admin_id == user_id,
+            ServerInstance.token_used_id.isnot(None),
+            ServerInstance.scheduled_deletion_date.is_(None)  # Még nem ütemezett törlésre
+        )
+    ).count()
+    
+    return active_tokens_count - used_tokens_count
 
 @router.get("", response_class=HTMLResponse)
 async def list_servers(
     request: Request,
+    current_user: User = Depends(require_server_admin),
     db: Session = Depends(get_db)
 ):
     """Server Admin: Szerverek listája"""
-    current_user = require_server_admin(request, db)
-    
     # Csak az aktuális user szervereit mutatjuk
-    servers = db.query(ServerInstance).filter(
+    # A játékot egy lépésben töltjük be, hogy a template ne kérdezzen le szerverenként
+    servers = db.query(ServerInstance).options(
+        selectinload(ServerInstance.game)
+    ).filter(
         ServerInstance.server_admin_id == current_user.id
     ).order_by(desc(ServerInstance.created_at)).all()
     
-    # Token információk hozzáadása minden szerverhez
-    from datetime import datetime, timedelta
-    now = datetime.now()
-    
-    servers_data = []
-    for server in servers:
-        server_dict = {
-            "server": server,
-            "token_days_left": None,
-            "deletion_days_left": None,
-            "token_expired": False
-        }
-        
-        if server.token_used_id and server.token_expires_at:
-            # Token lejárat számítás
-            if server.token_expires_at > now:
-                days_left = (server.token_expires_at - now).days
-                server_dict["token_days_left"] = days_left
-                server_dict["token_expired"] = False
-            else:
-                server_dict["token_expired"] = True
-                # Ha lejárt, akkor a törlési dátumot mutatjuk
-                if server.scheduled_deletion_date:
-                    if server.scheduled_deletion_date > now:
-                        days_left = (server.scheduled_deletion_date - now).days
-                        server_dict["deletion_days_left"] = days_left
-                    else:
-                        server_dict["deletion_days_left"] = 0
-        
-        servers_data.append(server_dict)
-    
-    return templates.TemplateResponse("servers/list.html", {
+    # A token információkat a template számolja ki a ServerInstance metódusaival,
+    # egyetlen "most" időponthoz viszonyítva
+    return TEMPLATES.TemplateResponse("servers/list.html", {
         "request": request,
         "current_user": current_user,
-        "servers_data": servers_data
+        "servers": servers,
+        "now": datetime.now()
     })
 
 @router.get("/start", response_class=HTMLResponse)
 async def show_start_server(
     request: Request,
+    current_user: User = Depends(require_server_admin),
     db: Session = Depends(get_db)
 ):
     """Server Admin: Szerver indítás form"""
-    current_user = require_server_admin(request, db)
-    
     # Csak az aktív játékokat mutatjuk
     games = db.query(Game).filter(Game.is_active == True).order_by(Game.name).all()
     
     # Ellenőrizzük, hogy van-e aktív token
-    # Számoljuk, hogy hány token van, ami NEM van használatban szerverrel
-    active_tokens_count = db.query(Token).filter(
-        and_(
-            Token.user_id == current_user.id,
-            Token.is_active == True,
-            Token.expires_at > datetime.now()
-        )
-    ).count()
-    
-    # Számoljuk, hogy hány szerver van aktív token-nel
-    used_tokens_count = db.query(ServerInstance).filter(
-        and_(
-            ServerInstance.server_admin_id == current_user.id,
-            ServerInstance.token_used_id.isnot(None),
-            ServerInstance.scheduled_deletion_date.is_(None)  # Még nem ütemezett törlésre
-        )
-    ).count()
+    available_tokens = count_available_tokens(db, current_user.id)
     
-    available_tokens = active_tokens_count - used_tokens_count
-    
-    return templates.TemplateResponse("servers/start.html", {
+    return TEMPLATES.TemplateResponse("servers/start.html", {
         "request": request,
         "current_user": current_user,
         "games": games,
@@ -131,11 +115,10 @@ async def start_server(
     game_id: int = Form(...),
     name: str = Form(...),
     port: int = Form(None),
+    current_user: User = Depends(require_server_admin),
     db: Session = Depends(get_db)
 ):
     """Server Admin: Szerver indítása"""
-    current_user = require_server_admin(request, db)
-    
     # Ellenőrizzük, hogy a játék létezik és aktív
     game = db.query(Game).filter(
         and_(Game.id == game_id, Game.is_active == True)
@@ -144,25 +127,7 @@ async def start_server(
         raise HTTPException(status_code=404, detail="Játék nem található vagy nem aktív")
     
     # Ellenőrizzük, hogy van-e elég aktív token
-    # Számoljuk, hogy hány token van, ami NEM van használatban szerverrel
-    active_tokens_count = db.query(Token).filter(
-        and_(
-            Token.user_id == current_user.id,
-            Token.is_active == True,
-            Token.expires_at > datetime.now()
-        )
-    ).count()
-    
-    # Számoljuk, hogy hány szerver van aktív token-nel
-    used_tokens_count = db.query(ServerInstance).filter(
-        and_(
-            ServerInstance.server_admin_id == current_user.id,
-            ServerInstance.token_used_id.isnot(None),
-            ServerInstance.scheduled_deletion_date.is_(None)  # Még nem ütemezett törlésre
-        )
-    ).count()
-    
-    available_tokens = active_tokens_count - used_tokens_count
+    available_tokens = count_available_tokens(db, current_user.id)
     
     if available_tokens <= 0:
         raise HTTPException(
@@ -181,7 +146,6 @@ async def start_server(
     ).subquery()
     
     # Legrégebbi token, ami nincs használatban
-    from sqlalchemy import not_
     active_token = db.query(Token).filter(
         and_(
             Token.user_id == current_user.id,
@@ -198,7 +162,6 @@ async def start_server(
         )
     
     # 30 nap a token lejárata után a törlési dátum
-    from datetime import timedelta
     scheduled_deletion = active_token.expires_at + timedelta(days=30)
     
     # Új szerver példány létrehozása
@@ -226,11 +189,10 @@ async def start_server(
 async def stop_server(
     request: Request,
     server_id: int,
+    current_user: User = Depends(require_server_admin),
     db: Session = Depends(get_db)
 ):
     """Server Admin: Szerver leállítása"""
-    current_user = require_server_admin(request, db)
-    
     server = db.query(ServerInstance).filter(
         and_(
             ServerInstance.id == server_id,
@@ -254,11 +216,10 @@ async def stop_server(
 async def delete_server(
     request: Request,
     server_id: int,
+    current_user: User = Depends(require_server_admin),
     db: Session = Depends(get_db)
 ):
     """Server Admin: Szerver törlése - token felszabadítása és szerver törlése"""
-    current_user = require_server_admin(request, db)
-    
     server = db.query(ServerInstance).filter(
         and_(
             ServerInstance.id == server_id,
@@ -2,32 +2,30 @@
 Settings router - felhasználói beállítások
 """
 
+import hmac
 from fastapi import APIRouter, Request, Form, HTTPException, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.database import get_db, User
 from app.services.auth_service import verify_password, get_password_hash
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from app.dependencies import get_session_user, invalidate_session_user
+from app.services.token_service import invalidate_assignable_users
+from app.templating import TEMPLATES
 
 router = APIRouter()
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-
 @router.get("/settings/profile", response_class=HTMLResponse)
-async def show_profile(request: Request, db: Session = Depends(get_db)):
+def show_profile(
+    request: Request,
+    current_user: Optional[User] = Depends(get_session_user),
+    db: Session = Depends(get_db)
+):
     """Felhasználói profil oldal"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "settings/profile.html",
         {
             "request": request,
@@ -36,18 +34,14 @@ async def show_profile(request: Request, db: Session = Depends(get_db)):
     )
 
 @router.post("/settings/profile")
-async def update_profile(
+def update_profile(
     request: Request,
     username: str = Form(...),
     email: str = Form(...),
+    current_user: Optional[User] = Depends(get_session_user),
     db: Session = Depends(get_db)
 ):
     """Felhasználói profil frissítése"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
@@ -62,6 +56,8 @@ async def update_profile(
         current_user.email_verified = False
     
     db.commit()
+    invalidate_session_user(current_user.id)
+    invalidate_assignable_users()
     
     # Session frissítése
     request.session["username"] = username
@@ -71,17 +67,16 @@ async def update_profile(
     return RedirectResponse(url="/settings/profile", status_code=302)
 
 @router.get("/settings/password", response_class=HTMLResponse)
-async def show_password_change(request: Request, db: Session = Depends(get_db)):
+def show_password_change(
+    request: Request,
+    current_user: Optional[User] = Depends(get_session_user),
+    db: Session = Depends(get_db)
+):
     """Jelszó változtatás oldal"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "settings/password.html",
         {
             "request": request,
@@ -90,39 +85,36 @@ async def show_password_change(request: Request, db: Session = Depends(get_db)):
     )
 
 @router.post("/settings/password")
-async def change_password(
+def change_password(
     request: Request,
     current_password: str = Form(...),
     new_password: str = Form(...),
     confirm_password: str = Form(...),
+    current_user: Optional[User] = Depends(get_session_user),
     db: Session = Depends(get_db)
 ):
     """Jelszó változtatás"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    # Jelenlegi jelszó ellenőrzése
-    if not verify_password(current_password, current_user.password_hash):
-        request.session["error"] = "Hibás jelenlegi jelszó!"
-        return RedirectResponse(url="/settings/password", status_code=302)
-    
-    # Új jelszó ellenőrzése
+    # Új jelszó ellenőrzése - olcsó ellenőrzések a bcrypt előtt
     if len(new_password) < 8:
         request.session["error"] = "Az új jelszónak legalább 8 karakter hosszúnak kell lennie!"
         return RedirectResponse(url="/settings/password", status_code=302)
     
-    if new_password != confirm_password:
+    if not hmac.compare_digest(new_password.encode('utf-8'), confirm_password.encode('utf-8')):
         request.session["error"] = "Az új jelszavak nem egyeznek!"
         return RedirectResponse(url="/settings/password", status_code=302)
     
+    # Jelenlegi jelszó ellenőrzése
+    if not verify_password(current_password, current_user.password_hash):
+        request.session["error"] = "Hibás jelenlegi jelszó!"
+        return RedirectResponse(url="/settings/password", status_code=302)
+    
     # Jelszó frissítése
     current_user.password_hash = get_password_hash(new_password)
     db.commit()
+    invalidate_session_user(current_user.id)
     
     request.session["success"] = "Jelszó sikeresen megváltoztatva!"
     return RedirectResponse(url="/settings/password", status_code=302)
@@ -2,12 +2,13 @@
 System monitoring router - szerver kihasználtság API
 """
 
-from fastapi import APIRouter, Request, Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, Response
+import asyncio
+import contextlib
+import json
 import platform
-import subprocess
+import re
 import time
 
 # Opcionális psutil import
@@ -21,8 +22,147 @@ except ImportError:
 
 router = APIRouter(prefix="/api/system", tags=["system"])
 
+# Rendszer statisztikák gyorsítótára - gyakori pollingnál nem olvassuk újra a kernel állapotot
+STATS_TTL = 1.0  # másodperc
+_STATS_CACHE = {"ts": 0.0, "body": None}  # body: előre szerializált JSON bájtok
+_STATS_LOCK = asyncio.Lock()
+
+if PSUTIL_AVAILABLE:
+    # Ezek futás közben nem változnak, elég egyszer lekérni
+    CPU_COUNT = psutil.cpu_count()
+    CPU_CORES = psutil.cpu_count(logical=False)
+    BOOT_TIME = psutil.boot_time()
+    # Első (eldobott) mérés: a további cpu_percent(interval=None) hívások ehhez képest számolnak
+    psutil.cpu_percent(interval=None)
+
+# Ping gyorsítótár - a háttér worker tölti, a kérés sosem indít ping folyamatot
+PING_HOST = ("8.8.8.8", 53)
+PING_INTERVAL = 5  # másodperc
+PING_TIMEOUT = 3  # másodperc
+_PING_CACHE = {"ms": None}
+
+_PING_TIME_RE = re.compile(r"time[=<]\s*([0-9.]+)")
+_PING_COUNT_FLAG = "-n" if platform.system().lower() == "windows" else "-c"
+
+async def _icmp_ping() -> float | None:
+    """ICMP ping a rendszer ping parancsával, aszinkron alfolyamatban (ms)"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ping", _PING_COUNT_FLAG, "1", PING_HOST[0],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except OSError:
+        # Nincs ping parancs a rendszeren
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=PING_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    match = _PING_TIME_RE.search(stdout.decode("utf-8", errors="ignore"))
+    return float(match.group(1)) if match else None
+
+async def _tcp_ping() -> float | None:
+    """Hálózati késleltetés mérése TCP kapcsolódási idővel (ms)"""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(*PING_HOST), timeout=PING_TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    elapsed_ms = (loop.time() - started) * 1000
+    writer.close()
+    # Megvárjuk a transport lezárását, különben "unclosed transport" figyelmeztetések gyűlnek
+    with contextlib.suppress(OSError, asyncio.TimeoutError):
+        await asyncio.wait_for(writer.wait_closed(), timeout=PING_TIMEOUT)
+    return round(elapsed_ms, 2)
+
+async def measure_ping() -> float | None:
+    """Ping mérés: ICMP, ha nem sikerül, TCP kapcsolódási idő"""
+    ping_ms = await _icmp_ping()
+    if ping_ms is None:
+        ping_ms = await _tcp_ping()
+    return ping_ms
+
+async def ping_monitor_worker():
+    """Ping worker - PING_INTERVAL másodpercenként frissíti a gyorsítótárat"""
+    while True:
+        try:
+            _PING_CACHE["ms"] = await measure_ping()
+        except Exception as e:
+            print(f"[WARNING] Ping mérés hiba: {e}")
+        await asyncio.sleep(PING_INTERVAL)
+
+def _collect_system_stats(disk) -> dict:
+    """Rendszer statisztikák összegyűjtése (nem blokkoló psutil hívásokkal)"""
+    # CPU kihasználtság (az előző mérés óta eltelt időre)
+    cpu_percent = psutil.cpu_percent(interval=None)
+    
+    # RAM információk
+    memory = psutil.virtual_memory()
+    ram_total = memory.total
+    ram_used = memory.used
+    ram_percent = memory.percent
+    ram_available = memory.available
+    
+    # HDD információk
+    hdd_total = disk.total
+    hdd_used = disk.used
+    hdd_free = disk.free
+    hdd_percent = (disk.used / disk.total) * 100
+    
+    # Hálózati információk
+    network = psutil.net_io_counters()
+    
+    # Uptime a gyorsítótárazott boot időből
+    now = time.time()
+    uptime_seconds = now - BOOT_TIME
+    uptime_hours = uptime_seconds / 3600
+    
+    return {
+        "cpu": {
+            "percent": cpu_percent,
+            "count": CPU_COUNT,
+            "cores": CPU_CORES
+        },
+        "ram": {
+            "total": ram_total,
+            "used": ram_used,
+            "available": ram_available,
+            "percent": ram_percent,
+            "total_gb": round(ram_total / (1024**3), 2),
+            "used_gb": round(ram_used / (1024**3), 2),
+            "available_gb": round(ram_available / (1024**3), 2)
+        },
+        "hdd": {
+            "total": hdd_total,
+            "used": hdd_used,
+            "free": hdd_free,
+            "percent": round(hdd_percent, 2),
+            "total_gb": round(hdd_total / (1024**3), 2),
+            "used_gb": round(hdd_used / (1024**3), 2),
+            "free_gb": round(hdd_free / (1024**3), 2)
+        },
+        "ping": {
+            "ms": _PING_CACHE["ms"]
+        },
+        "network": {
+            "bytes_sent": network.bytes_sent,
+            "bytes_recv": network.bytes_recv,
+            "packets_sent": network.packets_sent,
+            "packets_recv": network.packets_recv
+        },
+        "uptime": {
+            "hours": round(uptime_hours, 2),
+            "seconds": int(uptime_seconds)
+        },
+        "timestamp": int(now)
+    }
+
 @router.get("/stats")
-async def get_system_stats(request: Request, db: Session = Depends(get_db)):
+async def get_system_stats(request: Request):
     """Szerver kihasználtság lekérése"""
     if not PSUTIL_AVAILABLE:
         return JSONResponse(
@@ -31,128 +171,18 @@ async def get_system_stats(request: Request, db: Session = Depends(get_db)):
         )
     
     try:
-        # CPU kihasználtság
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_count = psutil.cpu_count()
-        
-        # RAM információk
-        memory = psutil.virtual_memory()
-        ram_total = memory.total
-        ram_used = memory.used
-        ram_percent = memory.percent
-        ram_available = memory.available
-        
-        # HDD információk
-        disk = psutil.disk_usage('/')
-        hdd_total = disk.total
-        hdd_used = disk.used
-        hdd_free = disk.free
-        hdd_percent = (disk.used / disk.total) * 100
-        
-        # Ping (localhost ping, vagy egy külső szerver)
-        ping_ms = get_ping_time()
+        async with _STATS_LOCK:
+            if _STATS_CACHE["body"] is None or time.monotonic() - _STATS_CACHE["ts"] >= STATS_TTL:
+                disk = await asyncio.to_thread(psutil.disk_usage, '/')
+                payload = _collect_system_stats(disk)
+                # Egyszer szerializálunk, a TTL-en belüli kérések a kész bájtokat kapják
+                _STATS_CACHE["body"] = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+                _STATS_CACHE["ts"] = time.monotonic()
+            body = _STATS_CACHE["body"]
         
-        # Hálózati információk
-        network = psutil.net_io_counters()
-        
-        # Boot idő
-        boot_time = psutil.boot_time()
-        uptime_seconds = time.time() - boot_time
-        uptime_hours = uptime_seconds / 3600
-        
-        return JSONResponse(content={
-            "cpu": {
-                "percent": cpu_percent,
-                "count": cpu_count,
-                "cores": psutil.cpu_count(logical=False)
-            },
-            "ram": {
-                "total": ram_total,
-                "used": ram_used,
-                "available": ram_available,
-                "percent": ram_percent,
-                "total_gb": round(ram_total / (1024**3), 2),
-                "used_gb": round(ram_used / (1024**3), 2),
-                "available_gb": round(ram_available / (1024**3), 2)
-            },
-            "hdd": {
-                "total": hdd_total,
-                "used": hdd_used,
-                "free": hdd_free,
-                "percent": round(hdd_percent, 2),
-                "total_gb": round(hdd_total / (1024**3), 2),
-                "used_gb": round(hdd_used / (1024**3), 2),
-                "free_gb": round(hdd_free / (1024**3), 2)
-            },
-            "ping": {
-                "ms": ping_ms
-            },
-            "network": {
-                "bytes_sent": network.bytes_sent,
-                "bytes_recv": network.bytes_recv,
-                "packets_sent": network.packets_sent,
-                "packets_recv": network.packets_recv
-            },
-            "uptime": {
-                "hours": round(uptime_hours, 2),
-                "seconds": int(uptime_seconds)
-            },
-            "timestamp": int(time.time())
-        })
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         return JSONResponse(
             status_code=500,
             content={"error": str(e)}
         )
-
-def get_ping_time():
-    """Ping idő mérése (localhost vagy külső szerver)"""
-    try:
-        # Próbáljuk meg a localhost ping-et
-        if platform.system().lower() == 'windows':
-            result = subprocess.run(
-                ["ping", "-n", "1", "127.0.0.1"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-        else:
-            result = subprocess.run(
-                ["ping", "-c", "1", "127.0.0.1"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-        
-        if result.returncode == 0:
-            # Parse ping output (egyszerűsített)
-            return 0.5  # Localhost ping általában < 1ms
-        return None
-    except:
-        try:
-            # Ha ping nem elérhető, próbáljuk meg egy külső szervert
-            if platform.system().lower() == 'windows':
-                result = subprocess.run(
-                    ["ping", "-n", "1", "8.8.8.8"],
-                    capture_output=True,
-                    text=True,
-                    timeout=3
-                )
-            else:
-                result = subprocess.run(
-                    ["ping", "-c", "1", "8.8.8.8"],
-                    capture_output=True,
-                    text=True,
-                    timeout=3
-                )
-            
-            if result.returncode == 0:
-                # Parse ping output
-                output = result.stdout
-                if 'time=' in output or 'time<' in output:
-                    # Egyszerűsített parsing
-                    return 10.0  # Alapértelmezett érték
-            return None
-        except:
-            return None
-
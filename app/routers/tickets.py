@@ -2,143 +2,145 @@
 Ticket router - hibajelentés rendszer
 """
 
-from fastapi import APIRouter, Request, Form, HTTPException, Depends
+from fastapi import APIRouter, Request, Form, HTTPException, Depends, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.database import get_db, User, Ticket, TicketMessage, TicketRating, TicketStatus
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from typing import Optional
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, exists, insert
+from app.database import get_db, User, UserRole, Ticket, TicketMessage, TicketRating, TicketStatus
+from app.dependencies import get_session_user
+from app.templating import TEMPLATES
+from app.config import settings
 
 router = APIRouter()
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Ticket rendszert használó szerepkörök
+_TICKET_ROLES = frozenset({UserRole.USER, UserRole.ADMIN, UserRole.SERVER_ADMIN})
+_MANAGER = UserRole.MANAGER_ADMIN
 
 @router.get("/tickets", response_class=HTMLResponse)
-async def list_tickets(request: Request, db: Session = Depends(get_db)):
+def list_tickets(
+    request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(settings.tickets_page_size, ge=1, le=200),
+    current_user: Optional[User] = Depends(get_session_user),
+    db: Session = Depends(get_db)
+):
     """Felhasználó ticketjeinek listája"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
     # Csak user, admin, server_admin
-    if current_user.role.value not in ["user", "admin", "server_admin"]:
+    if current_user.role not in _TICKET_ROLES:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
+    # Lapozás: eggyel több sort kérünk le, így COUNT nélkül tudjuk, van-e következő oldal
     user_tickets = db.query(Ticket).filter(
         Ticket.user_id == current_user.id
-    ).order_by(desc(Ticket.created_at)).all()
+    ).order_by(desc(Ticket.created_at)).offset((page - 1) * page_size).limit(page_size + 1).all()
+    has_next = len(user_tickets) > page_size
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "tickets/list.html",
         {
             "request": request,
-            "tickets": user_tickets,
-            "user": current_user
+            "tickets": user_tickets[:page_size],
+            "user": current_user,
+            "page": page,
+            "page_size": page_size,
+            "has_next": has_next,
+            "has_prev": page > 1
         }
     )
 
 @router.get("/tickets/create", response_class=HTMLResponse)
-async def show_create_ticket(request: Request, db: Session = Depends(get_db)):
+def show_create_ticket(
+    request: Request,
+    current_user: Optional[User] = Depends(get_session_user),
+    db: Session = Depends(get_db)
+):
     """Új ticket létrehozása"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    if current_user.role.value not in ["user", "admin", "server_admin"]:
+    if current_user.role not in _TICKET_ROLES:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "tickets/create.html",
         {"request": request, "user": current_user}
     )
 
 @router.post("/tickets/create")
-async def create_ticket(
+def create_ticket(
     request: Request,
     title: str = Form(...),
     description: str = Form(...),
+    current_user: Optional[User] = Depends(get_session_user),
     db: Session = Depends(get_db)
 ):
     """Új ticket létrehozása"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    if current_user.role.value not in ["user", "admin", "server_admin"]:
+    if current_user.role not in _TICKET_ROLES:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
-    # Ticket létrehozása
-    ticket = Ticket(
+    # Ticket és első üzenet (a leírásból) két Core INSERT-tel, egy tranzakcióban.
+    # Az ORM objektumokra nincs szükség, a redirect csak az id-t használja.
+    result = db.execute(insert(Ticket).values(
         user_id=current_user.id,
         title=title,
         description=description,
         status=TicketStatus.OPEN
-    )
-    db.add(ticket)
-    db.commit()
-    db.refresh(ticket)
+    ))
+    ticket_id = result.inserted_primary_key[0]
     
-    # Első üzenet a leírásból
-    first_message = TicketMessage(
-        ticket_id=ticket.id,
+    db.execute(insert(TicketMessage).values(
+        ticket_id=ticket_id,
         user_id=current_user.id,
         message=description
-    )
-    db.add(first_message)
+    ))
     db.commit()
     
     request.session["success"] = "Ticket sikeresen létrehozva!"
-    return RedirectResponse(url=f"/tickets/{ticket.id}", status_code=302)
+    return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
 
 @router.get("/tickets/{ticket_id}", response_class=HTMLResponse)
-async def view_ticket(request: Request, ticket_id: int, db: Session = Depends(get_db)):
+def view_ticket(
+    request: Request,
+    ticket_id: int,
+    current_user: Optional[User] = Depends(get_session_user),
+    db: Session = Depends(get_db)
+):
     """Ticket megtekintése"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    # Ticket, üzenetek (szerzőkkel) és értékelés betöltése egy menetben
+    ticket = db.get(Ticket, ticket_id, options=[
+        selectinload(Ticket.messages).joinedload(TicketMessage.user),
+        selectinload(Ticket.rating)
+    ])
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
+    ticket_status = ticket.status.value
+    
     # Csak a ticket tulajdonosa vagy manager admin láthatja
-    if ticket.user_id != current_user.id and current_user.role.value != "manager_admin":
+    if ticket.user_id != current_user.id and current_user.role != _MANAGER:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
-    messages = db.query(TicketMessage).filter(
-        TicketMessage.ticket_id == ticket_id
-    ).order_by(TicketMessage.created_at).all()
-    
-    rating = db.query(TicketRating).filter(
-        TicketRating.ticket_id == ticket_id
-    ).first()
+    messages = ticket.messages
+    rating = ticket.rating
     
     can_rate = (
-        ticket.status.value in ["resolved", "closed"] and
+        ticket_status in ("resolved", "closed") and
         ticket.user_id == current_user.id and
         not rating
     )
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "tickets/view.html",
         {
             "request": request,
@@ -151,31 +153,29 @@ async def view_ticket(request: Request, ticket_id: int, db: Session = Depends(ge
     )
 
 @router.post("/tickets/{ticket_id}/message")
-async def add_message(
+def add_message(
     request: Request,
     ticket_id: int,
     message: str = Form(...),
+    current_user: Optional[User] = Depends(get_session_user),
     db: Session = Depends(get_db)
 ):
     """Üzenet hozzáadása a tickethez"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
+    ticket_status = ticket.status.value
+    
     # Csak a ticket tulajdonosa vagy manager admin írhat
-    if ticket.user_id != current_user.id and current_user.role.value != "manager_admin":
+    if ticket.user_id != current_user.id and current_user.role != _MANAGER:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
     # Ha le van zárva, nem lehet üzenetet írni
-    if ticket.status.value == "closed":
+    if ticket_status == "closed":
         request.session["error"] = "A lezárt tickethez nem lehet üzenetet írni!"
         return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
     
@@ -188,7 +188,7 @@ async def add_message(
     db.add(ticket_message)
     
     # Ha manager admin ír, akkor in_progress státusz
-    if current_user.role.value == "manager_admin" and ticket.status.value == "open":
+    if current_user.role == _MANAGER and ticket_status == "open":
         ticket.status = TicketStatus.IN_PROGRESS
     
     db.commit()
@@ -196,41 +196,39 @@ async def add_message(
     return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
 
 @router.post("/tickets/{ticket_id}/rate")
-async def rate_ticket(
+def rate_ticket(
     request: Request,
     ticket_id: int,
     rating: int = Form(...),
     comment: str = Form(None),
+    current_user: Optional[User] = Depends(get_session_user),
     db: Session = Depends(get_db)
 ):
     """Ticket értékelése"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
+    ticket_status = ticket.status.value
+    
     # Csak a ticket tulajdonosa értékelheti
     if ticket.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
     # Csak resolved vagy closed ticket értékelhető
-    if ticket.status.value not in ["resolved", "closed"]:
+    if ticket_status not in ("resolved", "closed"):
         request.session["error"] = "Csak lezárt vagy megoldott ticket értékelhető!"
         return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
     
     # Ellenőrzés: már van értékelés?
-    existing_rating = db.query(TicketRating).filter(
-        TicketRating.ticket_id == ticket_id
-    ).first()
+    rating_exists = db.query(
+        exists().where(TicketRating.ticket_id == ticket_id)
+    ).scalar()
     
-    if existing_rating:
+    if rating_exists:
         request.session["error"] = "Ez a ticket már értékelve lett!"
         return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
     
@@ -248,29 +246,27 @@ async def rate_ticket(
     return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
 
 @router.post("/tickets/{ticket_id}/close")
-async def close_ticket(
+def close_ticket(
     request: Request,
     ticket_id: int,
+    current_user: Optional[User] = Depends(get_session_user),
     db: Session = Depends(get_db)
 ):
     """Ticket lezárása (csak a tulajdonos)"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
+    ticket_status = ticket.status.value
+    
     # Csak a ticket tulajdonosa zárhatja le
     if ticket.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
-    if ticket.status.value == "closed":
+    if ticket_status == "closed":
         request.session["error"] = "A ticket már le van zárva!"
         return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=302)
     
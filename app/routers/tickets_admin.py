@@ -2,73 +2,82 @@
 Ticket Admin router - Manager Admin ticket kezelés
 """
 
-from fastapi import APIRouter, Request, Form, HTTPException, Depends
+from fastapi import APIRouter, Request, Form, HTTPException, Depends, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, func
 from app.database import get_db, User, Ticket, TicketMessage, TicketStatus
-from app.dependencies import require_manager_admin
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from app.dependencies import require_manager_admin_session
+from app.templating import TEMPLATES
+from app.config import settings
 from datetime import datetime
 
 router = APIRouter()
 
-# Template-ek inicializálása
-BASE_DIR = Path(__file__).parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Ticket státusz érték -> enum (kivételkezelés nélküli validáláshoz)
+_STATUS_MAP = {s.value: s for s in TicketStatus}
 
 @router.get("/admin/tickets", response_class=HTMLResponse)
-async def list_all_tickets(request: Request, db: Session = Depends(get_db)):
+def list_all_tickets(
+    request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(settings.tickets_page_size, ge=1, le=200),
+    current_user = Depends(require_manager_admin_session),
+    db: Session = Depends(get_db)
+):
     """Összes ticket listája (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
     status_filter = request.query_params.get("status", "all")
     
     query = db.query(Ticket)
-    if status_filter != "all":
-        query = query.filter(Ticket.status == TicketStatus(status_filter))
-    
-    tickets = query.order_by(desc(Ticket.created_at)).all()
-    
-    # Statisztikák
-    stats = {
-        "open": db.query(Ticket).filter(Ticket.status == TicketStatus.OPEN).count(),
-        "in_progress": db.query(Ticket).filter(Ticket.status == TicketStatus.IN_PROGRESS).count(),
-        "resolved": db.query(Ticket).filter(Ticket.status == TicketStatus.RESOLVED).count(),
-        "closed": db.query(Ticket).filter(Ticket.status == TicketStatus.CLOSED).count(),
-        "total": db.query(Ticket).count()
-    }
-    
-    return templates.TemplateResponse(
+    filter_status = _STATUS_MAP.get(status_filter)
+    if filter_status is not None:
+        query = query.filter(Ticket.status == filter_status)
+    
+    # Lapozás: eggyel több sort kérünk le, így COUNT nélkül tudjuk, van-e következő oldal
+    tickets = query.order_by(desc(Ticket.created_at)).offset((page - 1) * page_size).limit(page_size + 1).all()
+    has_next = len(tickets) > page_size
+    
+    # Statisztikák - egyetlen GROUP BY lekérdezéssel
+    stats = {s.value: 0 for s in TicketStatus}
+    status_counts = db.query(Ticket.status, func.count(Ticket.id)).group_by(Ticket.status).all()
+    for ticket_status, count in status_counts:
+        stats[ticket_status.value] = count
+    stats["total"] = sum(stats.values())
+    
+    return TEMPLATES.TemplateResponse(
         "admin/tickets/list.html",
         {
             "request": request,
-            "tickets": tickets,
+            "tickets": tickets[:page_size],
             "stats": stats,
-            "status_filter": status_filter
+            "status_filter": status_filter,
+            "page": page,
+            "page_size": page_size,
+            "has_next": has_next,
+            "has_prev": page > 1
         }
     )
 
 @router.get("/admin/tickets/{ticket_id}", response_class=HTMLResponse)
-async def view_ticket_admin(request: Request, ticket_id: int, db: Session = Depends(get_db)):
+def view_ticket_admin(
+    request: Request,
+    ticket_id: int,
+    current_user = Depends(require_manager_admin_session),
+    db: Session = Depends(get_db)
+):
     """Ticket megtekintése (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    # Ticket, üzenetek (szerzőkkel) és értékelés betöltése egy menetben
+    ticket = db.get(Ticket, ticket_id, options=[
+        selectinload(Ticket.messages).joinedload(TicketMessage.user),
+        selectinload(Ticket.rating)
+    ])
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
-    messages = db.query(TicketMessage).filter(
-        TicketMessage.ticket_id == ticket_id
-    ).order_by(TicketMessage.created_at).all()
-    
-    from app.database import TicketRating
-    rating = db.query(TicketRating).filter(
-        TicketRating.ticket_id == ticket_id
-    ).first()
+    messages = ticket.messages
+    rating = ticket.rating
     
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "admin/tickets/view.html",
         {
             "request": request,
@@ -79,20 +88,21 @@ async def view_ticket_admin(request: Request, ticket_id: int, db: Session = Depe
     )
 
 @router.post("/admin/tickets/{ticket_id}/message")
-async def add_message_admin(
+def add_message_admin(
     request: Request,
     ticket_id: int,
     message: str = Form(...),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Üzenet hozzáadása (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
-    if ticket.status.value == "closed":
+    ticket_status = ticket.status.value
+    
+    if ticket_status == "closed":
         request.session["error"] = "A lezárt tickethez nem lehet üzenetet írni!"
         return RedirectResponse(url=f"/admin/tickets/{ticket_id}", status_code=302)
     
@@ -105,7 +115,7 @@ async def add_message_admin(
     db.add(ticket_message)
     
     # Státusz frissítése
-    if ticket.status.value == "open":
+    if ticket_status == "open":
         ticket.status = TicketStatus.IN_PROGRESS
     
     db.commit()
@@ -113,30 +123,31 @@ async def add_message_admin(
     return RedirectResponse(url=f"/admin/tickets/{ticket_id}", status_code=302)
 
 @router.post("/admin/tickets/{ticket_id}/status")
-async def change_status(
+def change_status(
     request: Request,
     ticket_id: int,
     status: str = Form(...),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Ticket státusz változtatása (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = db.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket nem található")
     
-    try:
-        ticket.status = TicketStatus(status)
-        
-        if status == "closed":
-            ticket.closed_at = datetime.utcnow()
-            ticket.closed_by_id = current_user.id
-        
-        db.commit()
-        request.session["success"] = "Ticket státusz sikeresen frissítve!"
-    except ValueError:
+    new_status = _STATUS_MAP.get(status)
+    if new_status is None:
         request.session["error"] = "Érvénytelen státusz!"
+        return RedirectResponse(url=f"/admin/tickets/{ticket_id}", status_code=302)
+    
+    ticket.status = new_status
+    
+    if new_status == TicketStatus.CLOSED:
+        ticket.closed_at = datetime.utcnow()
+        ticket.closed_by_id = current_user.id
+    
+    db.commit()
+    request.session["success"] = "Ticket státusz sikeresen frissítve!"
     
     return RedirectResponse(url=f"/admin/tickets/{ticket_id}", status_code=302)
 
@@ -2,62 +2,61 @@
 Token router
 """
 
-from fastapi import APIRouter, Depends, Request, Form, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Form, HTTPException, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
-from app.database import get_db, User, TokenType, UserRole, TokenExtensionRequest, TokenRequest, CartItem
-from app.services.token_service import generate_token, activate_token, send_token_to_user
-from app.services.notification_service import create_notification
-from app.database import Token, User, TokenExtensionRequest
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session, contains_eager
+from app.database import get_db, Token, User, TokenType, UserRole, TokenExtensionRequest, TokenRequest, CartItem, ServerInstance
+from app.services.token_service import (
+    generate_tokens_bulk, insert_tokens, activate_token, send_token_to_user_background,
+    get_assignable_users, invalidate_assignable_users
+)
+from app.services.notification_service import create_notification, create_notifications_bulk
+from app.services.pricing_service import period_months_to_days, AVAILABLE_PERIODS
 from app.config import settings
+from app.dependencies import require_manager_admin_session, invalidate_session_user
+from app.templating import TEMPLATES
 from datetime import datetime, timedelta
+from urllib.parse import urlencode
 
 router = APIRouter()
 
-def require_manager_admin(request: Request, db: Session) -> User:
-    """Manager Admin jogosultság ellenőrzése"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        from fastapi.responses import RedirectResponse
-        raise HTTPException(status_code=302, detail="Nincs bejelentkezve")
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
-    if not current_user or current_user.role.value != "manager_admin":
-        raise HTTPException(status_code=403, detail="Nincs jogosultságod")
-    return current_user
+# Token típusok megjelenítési neve (értesítésekhez)
+TYPE_TEXT = {TokenType.SERVER_TOKEN: "Server Token"}
+
+# Token/hosszabbítás igénylésre jogosult rangok
+_REQUESTER_ROLES = frozenset({UserRole.USER, UserRole.SERVER_ADMIN})
+
+# Listaoldalak alapértelmezett oldalmérete
+TOKENS_PAGE_SIZE = 50
 
 @router.get("/tokens/generate", response_class=HTMLResponse)
-async def show_generate(
+def show_generate(
     request: Request,
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Token generálás oldal"""
-    current_user = require_manager_admin(request, db)
+    # Összes user és server admin (gyorsítótárazva)
+    users = get_assignable_users(db)
     
-    # Összes user és server admin
-    users = db.query(User).filter(
-        User.role.in_(["user", "server_admin"])
-    ).order_by(User.username).all()
-    
-    from app.main import get_templates
-    templates = get_templates()
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "tokens/generate.html",
-        {"request": request, "users": users}
+        {"request": request, "users": users, "success": request.query_params.get("success")}
     )
 
 @router.post("/tokens/generate")
-async def generate(
+def generate(
     request: Request,
+    background_tasks: BackgroundTasks,
     user_id: int = Form(...),
     token_type: str = Form(...),
     expires_in_days: int = Form(None),
     token_count: int = Form(1),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Token generálás"""
-    current_user = require_manager_admin(request, db)
-    
     if token_type not in ["server_token"]:
         raise HTTPException(status_code=400, detail="Érvénytelen token típus")
     
@@ -66,25 +65,22 @@ async def generate(
     
     token_type_enum = TokenType.SERVER_TOKEN
     
-    # Több token generálása
-    generated_tokens = []
-    for i in range(token_count):
-        token = generate_token(
-            db,
-            current_user.id,
-            token_type_enum,
-            expires_in_days or settings.token_expiry_days
-        )
-        generated_tokens.append(token)
+    # Több token generálása egyetlen INSERT-tel
+    generated_tokens = generate_tokens_bulk(
+        db,
+        current_user.id,
+        token_type_enum,
+        token_count,
+        expires_in_days or settings.token_expiry_days
+    )
     
     # Server token automatikusan aktiváljuk és server_admin rangot adunk
     if token_type_enum == TokenType.SERVER_TOKEN:
         # Felhasználó lekérése
-        target_user = db.query(User).filter(User.id == user_id).first()
+        target_user = db.get(User, user_id)
         if target_user:
             # Ellenőrizzük a jelenlegi rangot
-            current_role_value = target_user.role.value if hasattr(target_user.role, 'value') else str(target_user.role)
-            if current_role_value == "user" or target_user.role == UserRole.USER:
+            if target_user.role == UserRole.USER:
                 # Rang frissítése
                 target_user.role = UserRole.SERVER_ADMIN
                 # Tokenek automatikus aktiválása
@@ -99,21 +95,30 @@ async def generate(
                     target_user.role = UserRole.SERVER_ADMIN
                     db.commit()
                     db.refresh(target_user)
+                invalidate_session_user(user_id)
+                invalidate_assignable_users()
     
     # Tokenek küldése (csak az elsőt küldjük email-ben, a többit csak értesítésben)
-    email_sent = False
     if generated_tokens:
-        # Első token email-ben is
-        email_sent = await send_token_to_user(db, generated_tokens[0], user_id)
+        # Első token email-ben is - háttérben, a válasz nem vár az SMTP-re
+        # (sikertelen küldés esetén a generáló admin értesítést kap)
+        background_tasks.add_task(
+            send_token_to_user_background, generated_tokens[0].id, user_id, notify_user_id=current_user.id
+        )
         
         # További tokenek csak értesítésben
         if len(generated_tokens) > 1:
-            from app.services.notification_service import create_notification
-            type_text = "Server Token"
-            from app.config import settings
+            type_text = TYPE_TEXT[TokenType.SERVER_TOKEN]
             
-            tokens_list = "\n".join([f"- {token.token}" for token in generated_tokens[1:]])
-            activation_links = "\n".join([f"- {settings.base_url}/tokens/activate?token={token.token}" for token in generated_tokens[1:]])
+            # Egyetlen bejárással építjük a token- és link-listát
+            token_lines = []
+            link_lines = []
+            base_url = settings.base_url
+            for token in generated_tokens[1:]:
+                token_lines.append(f"- {token.token}")
+                link_lines.append(f"- {base_url}/tokens/activate?token={token.token}")
+            tokens_list = "\n".join(token_lines)
+            activation_links = "\n".join(link_lines)
             
             create_notification(
                 db,
@@ -123,30 +128,22 @@ async def generate(
                 f"Ön számára {len(generated_tokens)} új {type_text} token lett generálva.\n\nTovábbi tokenek:\n{tokens_list}\n\nAktiválás linkek:\n{activation_links}\n\nLejárat: {generated_tokens[0].expires_at.strftime('%Y-%m-%d %H:%M:%S')}"
             )
     
-    from app.main import get_templates
-    templates = get_templates()
-    users = db.query(User).filter(User.role.in_(["user", "server_admin"])).all()
-    
     success_msg = f"{len(generated_tokens)} token sikeresen generálva!"
     if len(generated_tokens) > 1:
-        if email_sent:
-            success_msg += f" Az első token email-ben is elküldve, a többi értesítésben."
-        else:
-            success_msg += f" Az első token email küldése sikertelen volt, de az értesítésben megtalálod."
-    elif not email_sent:
-        success_msg += f" Figyelmeztetés: Az email küldése sikertelen volt, de az értesítésben megtalálod a tokent."
+        success_msg += " Az első token email-je küldésre vár (hiba esetén értesítést kapsz), a többi értesítésben érhető el."
+    else:
+        success_msg += " A token email-je küldésre vár (hiba esetén értesítést kapsz), értesítésben is elérhető."
     
-    return templates.TemplateResponse(
-        "tokens/generate.html",
-        {"request": request, "users": users, "success": success_msg}
+    # Post/Redirect/Get: az űrlapot a GET handler rendereli újra
+    return RedirectResponse(
+        url=f"/tokens/generate?{urlencode({'success': success_msg})}",
+        status_code=302
     )
 
 @router.get("/tokens/activate", response_class=HTMLResponse)
-async def show_activate(request: Request, db: Session = Depends(get_db)):
+def show_activate(request: Request, db: Session = Depends(get_db)):
     """Token aktiválás oldal"""
-    from app.main import get_templates
-    templates = get_templates()
-    return templates.TemplateResponse("tokens/activate.html", {"request": request})
+    return TEMPLATES.TemplateResponse("tokens/activate.html", {"request": request})
 
 @router.post("/tokens/activate")
 async def activate(
@@ -160,7 +157,7 @@ async def activate(
         return RedirectResponse(url="/login", status_code=302)
     
     # Felhasználó lekérése aktiválás előtt (a rang ellenőrzéshez)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         return RedirectResponse(url="/login", status_code=302)
     
@@ -186,9 +183,7 @@ async def activate(
         
         return RedirectResponse(url="/dashboard", status_code=302)
     else:
-        from app.main import get_templates
-        templates = get_templates()
-        return templates.TemplateResponse(
+        return TEMPLATES.TemplateResponse(
             "tokens/activate.html",
             {"request": request, "error": result["message"]}
         )
@@ -205,7 +200,7 @@ async def activate_by_token(
         return RedirectResponse(url="/login", status_code=302)
     
     # Felhasználó lekérése aktiválás előtt (a rang ellenőrzéshez)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         return RedirectResponse(url="/login", status_code=302)
     
@@ -232,128 +227,121 @@ async def activate_by_token(
     return RedirectResponse(url="/dashboard", status_code=302)
 
 @router.get("/tokens/list", response_class=HTMLResponse)
-async def list_tokens(
+def list_tokens(
     request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(TOKENS_PAGE_SIZE, ge=1, le=200),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Tokenek listázása (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
     # Összes token lekérése
-    tokens = db.query(Token).outerjoin(User, Token.user_id == User.id).order_by(Token.created_at.desc()).all()
-    
-    from app.main import get_templates
-    templates = get_templates()
-    return templates.TemplateResponse(
+    # Csak a template által megjelenített oszlopokat kérjük le (Row tuple-ök, ORM példányok nélkül)
+    tokens = db.query(
+        Token.id,
+        Token.token,
+        Token.is_active,
+        Token.created_at,
+        Token.expires_at,
+        User.username.label("owner_username"),
+        User.email.label("owner_email")
+    ).outerjoin(User, Token.user_id == User.id).order_by(
+        Token.created_at.desc()
+    ).offset((page - 1) * page_size).limit(page_size + 1).all()
+    # Egy extra sor jelzi, hogy van-e következő oldal (nincs külön COUNT lekérdezés)
+    has_next = len(tokens) > page_size
+    
+    return TEMPLATES.TemplateResponse(
         "tokens/list.html",
-        {"request": request, "tokens": tokens}
+        {
+            "request": request,
+            "tokens": tokens[:page_size],
+            "page": page,
+            "page_size": page_size,
+            "has_next": has_next,
+            "has_prev": page > 1
+        }
     )
 
 @router.get("/tokens/requests", response_class=HTMLResponse)
-async def list_token_requests(
+def list_token_requests(
     request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(TOKENS_PAGE_SIZE, ge=1, le=200),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Token igénylések listázása (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
     # Összes pending token igénylés lekérése
-    token_requests = db.query(TokenRequest).join(
+    token_requests = db.query(
+        TokenRequest.id,
+        TokenRequest.quantity,
+        TokenRequest.expires_in_days,
+        TokenRequest.notes,
+        TokenRequest.created_at,
+        User.username,
+        User.email
+    ).join(
         User, TokenRequest.user_id == User.id
     ).filter(
         TokenRequest.status == "pending"
-    ).order_by(TokenRequest.created_at.desc()).all()
+    ).order_by(
+        TokenRequest.created_at.desc()
+    ).offset((page - 1) * page_size).limit(page_size + 1).all()
+    has_next = len(token_requests) > page_size
     
-    from app.main import get_templates
-    templates = get_templates()
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "tokens/requests.html",
-        {"request": request, "token_requests": token_requests}
+        {
+            "request": request,
+            "token_requests": token_requests[:page_size],
+            "page": page,
+            "page_size": page_size,
+            "has_next": has_next,
+            "has_prev": page > 1
+        }
     )
 
 @router.post("/tokens/requests/{request_id}/process")
-async def process_token_request(
+def process_token_request(
     request: Request,
     request_id: int,
     action: str = Form(...),  # "approve" vagy "reject"
     notes: str = Form(None),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Manager Admin: Token igénylés feldolgozása"""
-    current_user = require_manager_admin(request, db)
-    
-    token_request = db.query(TokenRequest).filter(TokenRequest.id == request_id).first()
+    token_request = db.get(TokenRequest, request_id)
     if not token_request:
         raise HTTPException(status_code=404, detail="Token igénylés nem található")
     
     if action == "approve":
-        # Token generálás
-        generated_tokens = []
-        for i in range(token_request.quantity):
-            token = generate_token(
-                db,
-                current_user.id,
-                token_request.token_type,
-                token_request.expires_in_days or settings.token_expiry_days
-            )
-            generated_tokens.append(token)
-        
         # Felhasználó lekérése
-        user = db.query(User).filter(User.id == token_request.user_id).first()
+        user = db.get(User, token_request.user_id)
         if not user:
             raise HTTPException(status_code=404, detail="Felhasználó nem található")
         
-        # Tokenek hozzárendelése a felhasználóhoz
-        for token in generated_tokens:
-            token.user_id = token_request.user_id
-            token.is_active = True
-            token.activated_at = datetime.now()
-        
-        # Ha user token típusú, akkor automatikusan server_admin rangot adunk
-        # (csak akkor, ha még user rangú)
-        role_changed = False
-        
-        # Ellenőrizzük, hogy server token típusú-e
-        # A token_type enumként van tárolva az adatbázisban
-        token_type_value = None
-        if hasattr(token_request.token_type, 'value'):
-            token_type_value = token_request.token_type.value
-        else:
-            token_type_value = str(token_request.token_type)
-        
-        # Ellenőrizzük, hogy server token típusú-e
-        is_server_token = (token_type_value == "server_token" or 
-                          token_type_value == "user" or  # Backward compatibility
-                          token_request.token_type == TokenType.SERVER_TOKEN or
-                          token_request.token_type == TokenType.USER)  # Backward compatibility
+        # Tokenek generálása egyetlen INSERT-tel, már a felhasználóhoz rendelve és aktiválva
+        insert_tokens(
+            db,
+            current_user.id,
+            token_request.token_type,
+            token_request.quantity,
+            token_request.expires_in_days or settings.token_expiry_days,
+            user_id=token_request.user_id
+        )
         
-        # Csak akkor frissítjük, ha server token ÉS még user rangú
-        if is_server_token:
-            # Ellenőrizzük a jelenlegi rangot
-            current_role_value = user.role.value if hasattr(user.role, 'value') else str(user.role)
-            is_user_role = (current_role_value == "user" or user.role == UserRole.USER)
-            
-            # Csak akkor frissítjük, ha user rangú
-            if is_user_role:
-                # Rang frissítése
-                user.role = UserRole.SERVER_ADMIN
-                role_changed = True
-                
-                # Azonnal commit, hogy biztosan mentésre kerüljön
-                db.commit()
-                
-                # Frissítjük a user objektumot
-                db.refresh(user)
-                
-                # Ellenőrizzük, hogy tényleg változott-e
-                final_role_value = user.role.value if hasattr(user.role, 'value') else str(user.role)
-                if final_role_value != "server_admin":
-                    # Ha még mindig nem változott, próbáljuk meg újra
-                    user.role = UserRole.SERVER_ADMIN
-                    db.commit()
-                    db.refresh(user)
+        # Server token esetén a user rangú felhasználó automatikusan server_admin lesz
+        # (a régi "user"/"server_admin" típusokat az EnumType SERVER_TOKEN-re alakítja)
+        role_changed = (
+            token_request.token_type == TokenType.SERVER_TOKEN and
+            user.role == UserRole.USER
+        )
+        if role_changed:
+            user.role = UserRole.SERVER_ADMIN
         
-        # Token igénylés státusz frissítése
+        # Token igénylés státusz frissítése - minden egy tranzakcióban, egy commit-tal
         token_request.status = "approved"
         token_request.processed_at = datetime.now()
         token_request.processed_by_id = current_user.id
@@ -361,18 +349,9 @@ async def process_token_request(
         
         # Értesítés küldése
         role_message = ""
-        # Ellenőrizzük a token_type-ot az értesítéshez is
-        token_type_for_notification = token_request.token_type
-        if isinstance(token_type_for_notification, str):
-            token_type_for_notification = TokenType(token_type_for_notification)
-        
-        is_server_token_for_notification = (token_type_for_notification == TokenType.SERVER_TOKEN or
-                                           token_type_for_notification == TokenType.USER or  # Backward compatibility
-                                           (hasattr(token_type_for_notification, 'value') and 
-                                            (token_type_for_notification.value == "server_token" or
-                                             token_type_for_notification.value == "user")))  # Backward compatibility
-        
-        if is_server_token_for_notification and role_changed:
+        if role_changed:
+            invalidate_session_user(user.id)
+            invalidate_assignable_users()
             role_message = " A rangod automatikusan frissült Server Admin-re."
         
         create_notification(
@@ -416,24 +395,25 @@ async def process_token_request(
     raise HTTPException(status_code=400, detail="Érvénytelen művelet")
 
 @router.get("/tokens/extension-requests", response_class=HTMLResponse)
-async def list_extension_requests(
+def list_extension_requests(
     request: Request,
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Token hosszabbítási kérelmek listázása (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
     # Összes pending token hosszabbítási kérés lekérése
     extension_requests = db.query(TokenExtensionRequest).join(
         User, TokenExtensionRequest.user_id == User.id
     ).join(
         Token, TokenExtensionRequest.token_id == Token.id
+    ).options(
+        contains_eager(TokenExtensionRequest.user),
+        contains_eager(TokenExtensionRequest.token)
     ).filter(
         TokenExtensionRequest.status == "pending"
     ).order_by(TokenExtensionRequest.created_at.desc()).all()
     
     # Új lejárat számítása minden kéréshez
-    from app.services.pricing_service import period_months_to_days, AVAILABLE_PERIODS
     for req in extension_requests:
         # Csak period_months-t használunk, backward compatibility nélkül
         if req.period_months and req.period_months in AVAILABLE_PERIODS:
@@ -449,39 +429,33 @@ async def list_extension_requests(
         else:
             req.new_expires_at = datetime.now() + timedelta(days=days)
     
-    from app.main import get_templates
-    templates = get_templates()
-    return templates.TemplateResponse(
+    return TEMPLATES.TemplateResponse(
         "tokens/extension_requests.html",
         {"request": request, "extension_requests": extension_requests}
     )
 
 @router.post("/tokens/extension-requests/{request_id}/process")
-async def process_extension_request(
+def process_extension_request(
     request: Request,
     request_id: int,
     action: str = Form(...),  # "approve" vagy "reject"
     notes: str = Form(None),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Manager Admin: Token hosszabbítási kérés feldolgozása"""
-    current_user = require_manager_admin(request, db)
-    
-    extension_request = db.query(TokenExtensionRequest).filter(
-        TokenExtensionRequest.id == request_id
-    ).first()
+    extension_request = db.get(TokenExtensionRequest, request_id)
     
     if not extension_request:
         raise HTTPException(status_code=404, detail="Hosszabbítási kérés nem található")
     
     if action == "approve":
         # Token hosszabbítás
-        token = db.query(Token).filter(Token.id == extension_request.token_id).first()
+        token = db.get(Token, extension_request.token_id)
         if not token:
             raise HTTPException(status_code=404, detail="Token nem található")
         
         # Csak period_months-t használunk, backward compatibility nélkül
-        from app.services.pricing_service import period_months_to_days, AVAILABLE_PERIODS
         if extension_request.period_months and extension_request.period_months in AVAILABLE_PERIODS:
             days = period_months_to_days(extension_request.period_months)
         elif extension_request.requested_days:
@@ -498,14 +472,14 @@ async def process_extension_request(
         token.expires_at = new_expires_at
         
         # Ha a token használatban van szerverrel, akkor frissítsük a szerver token_expires_at mezőjét is
-        from app.database import ServerInstance
-        servers = db.query(ServerInstance).filter(
-            ServerInstance.token_used_id == token.id
-        ).all()
-        
-        for server in servers:
-            server.token_expires_at = new_expires_at
-            server.scheduled_deletion_date = new_expires_at + timedelta(days=30)
+        db.execute(
+            update(ServerInstance)
+            .where(ServerInstance.token_used_id == token.id)
+            .values(
+                token_expires_at=new_expires_at,
+                scheduled_deletion_date=new_expires_at + timedelta(days=30)
+            )
+        )
         
         # Hosszabbítási kérés státusz frissítése
         extension_request.status = "approved"
@@ -520,7 +494,7 @@ async def process_extension_request(
             extension_request.user_id,
             "token_extension_approved",
             "Token hosszabbítás jóváhagyva",
-            f"A token hosszabbítási kérelmed jóváhagyásra került.\n\nHosszabbítás: {extension_request.period_months if extension_request.period_months else extension_request.requested_days} {'hónap' if extension_request.period_months else 'nap'}\nÚj lejárat: {new_expires_at.strftime('%Y-%m-%d %H:%M')}"
+            f"A token hosszabbítási kérelmed jóváhagyásra került.\n\nHosszabbítás: {extension_request.period_months if extension_request.period_months else extension_request.requested_days} {'hónap' if extension_request.period_months else 'nap'}\nÚj lejárat: {new_expires_at.isoformat(sep=' ', timespec='minutes')}"
         )
         
         return RedirectResponse(
@@ -557,15 +531,14 @@ async def process_extension_request(
 
 
 @router.post("/tokens/delete")
-async def delete_token(
+def delete_token(
     request: Request,
     token_id: int = Form(...),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Token törlése (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
-    token = db.query(Token).filter(Token.id == token_id).first()
+    token = db.get(Token, token_id)
     if not token:
         raise HTTPException(status_code=404, detail="Token nem található")
     
@@ -575,24 +548,21 @@ async def delete_token(
     return RedirectResponse(url="/tokens/list?success=Token+sikeresen+törölve", status_code=302)
 
 @router.post("/tokens/extend")
-async def extend_token(
+def extend_token(
     request: Request,
     token_id: int = Form(...),
     additional_days: int = Form(...),
+    current_user = Depends(require_manager_admin_session),
     db: Session = Depends(get_db)
 ):
     """Token hosszabbítása (Manager Admin)"""
-    current_user = require_manager_admin(request, db)
-    
     if additional_days < 1 or additional_days > 365:
         raise HTTPException(status_code=400, detail="A hosszabbítás 1 és 365 nap között lehet")
     
-    token = db.query(Token).filter(Token.id == token_id).first()
+    token = db.get(Token, token_id)
     if not token:
         raise HTTPException(status_code=404, detail="Token nem található")
     
-    from datetime import datetime, timedelta
-    
     # Ha a token már lejárt, akkor a mai dátumtól számolunk
     # Ha még nem járt le, akkor a jelenlegi lejárati dátumtól
     if token.expires_at and token.expires_at > datetime.now():
@@ -601,28 +571,28 @@ async def extend_token(
         new_expires_at = datetime.now() + timedelta(days=additional_days)
     
     token.expires_at = new_expires_at
-    db.commit()
     
     # Ha a token használatban van szerverrel, akkor frissítsük a szerver token_expires_at mezőjét is
-    from app.database import ServerInstance
-    servers = db.query(ServerInstance).filter(
-        ServerInstance.token_used_id == token.id
-    ).all()
-    
-    for server in servers:
-        server.token_expires_at = new_expires_at
-        # Frissítsük a scheduled_deletion_date-et is (30 nap a token lejárata után)
-        server.scheduled_deletion_date = new_expires_at + timedelta(days=30)
+    # (és a scheduled_deletion_date-et: 30 nap a token lejárata után) - egyetlen UPDATE, egy tranzakció
+    db.execute(
+        update(ServerInstance)
+        .where(ServerInstance.token_used_id == token.id)
+        .values(
+            token_expires_at=new_expires_at,
+            scheduled_deletion_date=new_expires_at + timedelta(days=30)
+        )
+    )
     
     db.commit()
     
+    success_msg = f"Token hosszabbítva {additional_days} napra. Új lejárat: {new_expires_at.isoformat(sep=' ', timespec='minutes')}"
     return RedirectResponse(
-        url=f"/tokens/list?success=Token+hosszabbítva+{additional_days}+napra.+Új+lejárat:+{new_expires_at.strftime('%Y-%m-%d %H:%M')}",
+        url=f"/tokens/list?{urlencode({'success': success_msg})}",
         status_code=302
     )
 
 @router.post("/tokens/request-extension")
-async def request_token_extension(
+def request_token_extension(
     request: Request,
     token_id: int = Form(...),
     period_months: int = Form(...),  # Kötelező, csak a kijelölt periódusok
@@ -634,32 +604,34 @@ async def request_token_extension(
     if not user_id:
         return RedirectResponse(url="/login", status_code=302)
     
-    current_user = db.query(User).filter(User.id == user_id).first()
-    if not current_user or current_user.role.value not in ["user", "server_admin"]:
+    current_user = db.get(User, user_id)
+    if not current_user or current_user.role not in _REQUESTER_ROLES:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
     # Periódus ellenőrzése - csak a kijelölt periódusok engedélyezettek
-    from app.services.pricing_service import AVAILABLE_PERIODS
     if period_months not in AVAILABLE_PERIODS:
         raise HTTPException(status_code=400, detail="Érvénytelen periódus. Csak 1, 3, 6, vagy 12 hónap választható.")
     
     # Token ellenőrzése - csak a saját tokenjeit kérheti
-    token = db.query(Token).filter(
-        Token.id == token_id,
-        Token.user_id == current_user.id
-    ).first()
+    # (csak a létezés számít, a Token sort nem töltjük be)
+    owns_token = db.scalar(
+        select(1).where(
+            Token.id == token_id,
+            Token.user_id == current_user.id
+        ).limit(1)
+    )
     
-    if not token:
+    if not owns_token:
         raise HTTPException(status_code=404, detail="Token nem található vagy nincs hozzáférésed hozzá")
     
     # Ellenőrizzük, hogy van-e már ilyen elem a kosárban
-    existing_cart_item = db.query(CartItem).filter(
+    cart_item_exists = db.query(exists().where(
         CartItem.user_id == current_user.id,
         CartItem.item_type == "token_extension",
         CartItem.token_id == token_id
-    ).first()
+    )).scalar()
     
-    if existing_cart_item:
+    if cart_item_exists:
         return RedirectResponse(
             url="/dashboard?error=Már+van+ilyen+elem+a+kosárban",
             status_code=302
@@ -683,7 +655,7 @@ async def request_token_extension(
     )
 
 @router.post("/tokens/request")
-async def request_token(
+def request_token(
     request: Request,
     request_type: str = Form(...),  # "cart" vagy "free"
     token_type: str = Form(...),
@@ -698,8 +670,8 @@ async def request_token(
     if not user_id:
         return RedirectResponse(url="/login", status_code=302)
     
-    current_user = db.query(User).filter(User.id == user_id).first()
-    if not current_user or current_user.role.value not in ["user", "server_admin"]:
+    current_user = db.get(User, user_id)
+    if not current_user or current_user.role not in _REQUESTER_ROLES:
         raise HTTPException(status_code=403, detail="Nincs jogosultságod")
     
     if token_type not in ["server_token"]:
@@ -709,7 +681,6 @@ async def request_token(
         raise HTTPException(status_code=400, detail="A mennyiség 1 és 100 között lehet")
     
     # Periódus ellenőrzése
-    from app.services.pricing_service import AVAILABLE_PERIODS
     if period_months and period_months not in AVAILABLE_PERIODS:
         raise HTTPException(status_code=400, detail="Érvénytelen periódus. Csak 1, 3, 6, vagy 12 hónap választható.")
     
@@ -742,7 +713,6 @@ async def request_token(
     elif request_type == "free":
         # Ingyenes igénylés manager admintól
         # Period_months-t napokká konvertáljuk backward compatibility-ért
-        from app.services.pricing_service import period_months_to_days
         final_expires_in_days = None
         if period_months:
             final_expires_in_days = period_months_to_days(period_months)
@@ -760,17 +730,17 @@ async def request_token(
         db.add(token_request)
         db.commit()
         
-        # Értesítés küldése a manager adminoknak
-        from app.database import UserRole
-        manager_admins = db.query(User).filter(User.role == UserRole.MANAGER_ADMIN).all()
-        for admin in manager_admins:
-            create_notification(
-                db,
-                admin.id,
-                "token_request",
-                "Új token igénylés",
-                f"{current_user.username} új token igénylést küldött.\nTípus: {token_type}\nMennyiség: {quantity}"
-            )
+        # Értesítés küldése a manager adminoknak (egyetlen INSERT)
+        manager_admin_ids = [
+            admin_id for (admin_id,) in db.query(User.id).filter(User.role == UserRole.MANAGER_ADMIN)
+        ]
+        create_notifications_bulk(
+            db,
+            manager_admin_ids,
+            "token_request",
+            "Új token igénylés",
+            f"{current_user.username} új token igénylést küldött.\nTípus: {token_type}\nMennyiség: {quantity}"
+        )
         
         return RedirectResponse(
             url="/dashboard?success=Token+igénylés+elküldve+a+Manager+Adminisztrátornak",
@@ -2,126 +2,193 @@
 Update router - Manager Admin funkciók
 """
 
-from fastapi import APIRouter, Request, HTTPException, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from sqlalchemy.orm import Session
-from app.database import get_db, User
+from fastapi import APIRouter, Request, Depends
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from app.dependencies import require_manager_admin_session
+from app.templating import BASE_DIR, TEMPLATES
 from pathlib import Path
 import subprocess
+import asyncio
 import os
 import json
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+
+# Opcionális pystemd import - a service állapotot D-Bus-on kérdezi le systemctl indítása nélkül
+try:
+    from pystemd.systemd1 import Unit
+    PYSTEMD_AVAILABLE = True
+except ImportError:
+    PYSTEMD_AVAILABLE = False
+
+# Opcionális pygit2 import - packfile-ban lévő commitoknál is git folyamat nélkül olvas
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
 
 router = APIRouter(prefix="/admin/update", tags=["update"])
 
-def require_manager_admin(request: Request, db: Session = Depends(get_db)) -> User:
-    """Manager Admin jogosultság ellenőrzése"""
-    user_id = request.session.get("user_id")
-    if not user_id:
-        raise HTTPException(status_code=302, detail="Nincs bejelentkezve")
-    
-    current_user = db.query(User).filter(User.id == user_id).first()
-    if not current_user or current_user.role.value != "manager_admin":
-        raise HTTPException(status_code=403, detail="Nincs jogosultságod")
-    return current_user
+PROJECT_DIR = BASE_DIR
+
+# Az update script létezését egyszer, betöltéskor ellenőrizzük (bash-sel futtatjuk, futtatási jog nem kell)
+UPDATE_SCRIPT = PROJECT_DIR / "scripts" / "update.sh"
+UPDATE_SCRIPT_OK = UPDATE_SCRIPT.is_file()
+
+# Betöltéskor egyszer feloldott útvonalak
+UPDATE_FLAG_FILE = PROJECT_DIR / ".updating"
+UPDATE_LOG_DIR = PROJECT_DIR / "logs"
+GIT_DIR = PROJECT_DIR / ".git"
+_GIT_HEAD_FILE = GIT_DIR / "HEAD"
+_GIT_LOGS_HEAD_FILE = GIT_DIR / "logs" / "HEAD"
+
+# Update ellenőrzés eredményének gyorsítótára (gyors egymás utáni ellenőrzésekhez)
+CHECK_UPDATE_TTL = 30  # másodperc
+_check_update_cache = {"ts": 0.0, "result": None}
+_check_update_lock = asyncio.Lock()  # egyszerre csak egy fetch fusson
+
+# Service státusz: a systemctl-t legfeljebb ilyen gyakran hívjuk (a /status és a stream is ezt használja)
+SERVICE_NAME = "zedinarkmanager"
+SERVICE_CHECK_INTERVAL = 2  # másodperc
+STATUS_STREAM_INTERVAL = 1  # másodperc, a .updating flag ellenőrzésének gyakorisága
+_service_state = {"ts": 0.0, "active": False}
+
+# .updating flag állapot gyorsítótár (az update.sh a végén maga törli a fájlt)
+FLAG_CHECK_INTERVAL = 0.5  # másodperc
+_update_flag_state = {"ts": 0.0, "value": False}
+
+# Git információ gyorsítótár: a .git/HEAD és .git/logs/HEAD mtime-ja a kulcs
+# (commit, checkout, pull mindkettőt/egyiket módosítja, így az invalidálás automatikus)
+_git_info_cache = {"key": None, "value": None}
+_pygit2_repo = None  # pygit2.Repository, első használatkor nyitjuk meg
+
+async def run_command(*cmd: str, cwd: Path | None = None, timeout: float = 10) -> tuple[int, str, str]:
+    """
+    Külső parancs futtatása aszinkron alfolyamatban, az event loop blokkolása nélkül.
+    Visszatérés: (returncode, stdout, stderr). Időtúllépéskor a folyamatot leállítja
+    és asyncio.TimeoutError-t dob.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace")
+    )
 
 @router.get("", response_class=HTMLResponse)
-async def update_page(request: Request, db: Session = Depends(get_db)):
+async def update_page(request: Request, current_user = Depends(require_manager_admin_session)):
     """Update oldal megjelenítése"""
-    # Manager Admin ellenőrzés
-    user_id = request.session.get("user_id")
-    if not user_id:
-        return RedirectResponse(url="/login", status_code=302)
-    
-    try:
-        require_manager_admin(request, db)
-    except HTTPException:
-        return RedirectResponse(url="/dashboard", status_code=302)
-    
-    from app.main import get_templates
-    templates = get_templates()
-    
     # Git információk lekérése
-    project_dir = Path(__file__).parent.parent.parent
-    git_info = get_git_info(project_dir)
+    git_info = await get_git_info()
+    is_updating = is_update_in_progress()
     
-    return templates.TemplateResponse(
+    # Az oldal a commit-tól, az update flagtől, a fejlécben látható felhasználótól és a
+    # sidebar Ark játéklistájától függ: ha a böngésző ugyanezt a verziót tárolja, 304-et
+    # adunk renderelés nélkül. Függő flash üzenet esetén mindig renderelünk, hogy megjelenjen.
+    ark_games = getattr(request.state, "ark_games", None) or []
+    games_hash = zlib.crc32(repr([(game.id, game.name) for game in ark_games]).encode("utf-8"))
+    username_hash = zlib.crc32(str(request.session.get("username", "")).encode("utf-8"))
+    etag = (
+        f'W/"{git_info["commit"]}-{int(is_updating)}-{current_user.id}-{current_user.role.value}'
+        f'-{username_hash:08x}-{games_hash:08x}"'
+    )
+    has_flash = "success" in request.session or "error" in request.session
+    if not has_flash and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return TEMPLATES.TemplateResponse(
         "admin/update.html",
         {
             "request": request,
             "git_info": git_info,
-            "is_updating": is_update_in_progress()
-        }
+            "is_updating": is_updating
+        },
+        headers={"ETag": etag, "Cache-Control": "private, must-revalidate"}
     )
 
 @router.post("/check")
-async def check_update(request: Request, db: Session = Depends(get_db)):
+async def check_update(request: Request, current_user = Depends(require_manager_admin_session)):
     """Git update ellenőrzése"""
-    # Manager Admin ellenőrzés
     try:
-        require_manager_admin(request, db)
-    except HTTPException as e:
-        if e.status_code == 302:
-            raise HTTPException(status_code=401, detail="Nincs bejelentkezve")
-        raise HTTPException(status_code=403, detail="Nincs jogosultság")
-    
-    project_dir = Path(__file__).parent.parent.parent
-    
-    try:
-        # Git fetch
-        result = subprocess.run(
-            ["git", "fetch", "origin", "main"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        # Git log ellenőrzése
-        result = subprocess.run(
-            ["git", "log", "HEAD..origin/main", "--oneline"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        has_update = len(result.stdout.strip()) > 0
-        commits = result.stdout.strip().split("\n") if has_update else []
-        
-        return JSONResponse(content={
-            "has_update": has_update,
-            "commits": commits[:10],  # Legutóbbi 10 commit
-            "commit_count": len(commits)
-        })
+        async with _check_update_lock:
+            # A lock alatt újra ellenőrizzük: egy párhuzamos kérés közben frissíthette
+            now = time.monotonic()
+            if _check_update_cache["result"] is None or now - _check_update_cache["ts"] >= CHECK_UPDATE_TTL:
+                _check_update_cache["result"] = await check_remote_update()
+                _check_update_cache["ts"] = now
+        return JSONResponse(content=_check_update_cache["result"])
     except Exception as e:
         return JSONResponse(
             status_code=500,
             content={"error": str(e)}
         )
 
-@router.post("/execute")
-async def execute_update(request: Request, db: Session = Depends(get_db)):
-    """Update végrehajtása"""
-    # Manager Admin ellenőrzés
+async def check_remote_update() -> dict:
+    """
+    Távoli main branch összevetése a helyi HEAD-del.
+    A helyi SHA-t a .git fájlokból olvassuk, a távolit ls-remote-tal kérjük le (nincs objektum letöltés);
+    git log csak akkor fut, ha a két SHA eltér, fetch pedig csak akkor, ha a távoli commit még nincs meg helyben.
+    """
     try:
-        require_manager_admin(request, db)
-    except HTTPException as e:
-        if e.status_code == 302:
-            raise HTTPException(status_code=401, detail="Nincs bejelentkezve")
-        raise HTTPException(status_code=403, detail="Nincs jogosultság")
+        local_sha = _read_head()[1]
+    except OSError:
+        local_sha = None
+    if not local_sha:
+        _, local_sha, _ = await run_command("git", "rev-parse", "HEAD", cwd=PROJECT_DIR, timeout=5)
+        local_sha = local_sha.strip()
+    
+    _, stdout, _ = await run_command("git", "ls-remote", "origin", "refs/heads/main", cwd=PROJECT_DIR)
+    remote_sha = stdout.split()[0] if stdout.strip() else ""
+    
+    if local_sha and remote_sha == local_sha:
+        return {"has_update": False, "commits": [], "commit_count": 0}
+    
+    # Ha a távoli commit már megvan helyben (pl. egy korábbi ellenőrzésből), nem kell fetch
+    target = "origin/main"
+    if remote_sha:
+        returncode, _, _ = await run_command("git", "cat-file", "-e", f"{remote_sha}^{{commit}}", cwd=PROJECT_DIR, timeout=5)
+        if returncode == 0:
+            target = remote_sha
+    
+    if target == "origin/main":
+        # Git fetch
+        await run_command("git", "fetch", "origin", "main", cwd=PROJECT_DIR)
+    
+    # Git log ellenőrzése
+    _, stdout, _ = await run_command("git", "log", f"HEAD..{target}", "--oneline", cwd=PROJECT_DIR)
+    
+    has_update = len(stdout.strip()) > 0
+    commits = stdout.strip().split("\n") if has_update else []
     
+    return {
+        "has_update": has_update,
+        "commits": commits[:10],  # Legutóbbi 10 commit
+        "commit_count": len(commits)
+    }
+
+@router.post("/execute")
+async def execute_update(request: Request, current_user = Depends(require_manager_admin_session)):
+    """Update végrehajtása"""
     # Ellenőrizzük, hogy valóban folyamatban van-e az update
     updating = is_update_in_progress()
     if updating:
         # Ellenőrizzük, hogy az update script még fut-e
         try:
-            result = subprocess.run(
-                ["pgrep", "-f", "update.sh"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            script_running = result.returncode == 0
+            returncode, _, _ = await run_command("pgrep", "-f", "update.sh", timeout=2)
+            script_running = returncode == 0
             if script_running:
                 return JSONResponse(
                     status_code=400,
@@ -137,28 +204,25 @@ async def execute_update(request: Request, db: Session = Depends(get_db)):
                 content={"error": "Update már folyamatban van. Ha biztos vagy benne, hogy nincs, töröld a .updating fájlt."}
             )
     
-    # Update flag beállítása
-    set_update_in_progress(True)
-    
-    project_dir = Path(__file__).parent.parent.parent
-    update_script = project_dir / "scripts" / "update.sh"
-    
-    if not update_script.exists():
-        set_update_in_progress(False)
+    if not UPDATE_SCRIPT_OK:
         return JSONResponse(
             status_code=500,
             content={"error": "Update script nem található"}
         )
     
-    try:
-        # Update script futtatása háttérben
-        # A script végén automatikusan törli a flagot
-        process = subprocess.Popen(
-            ["bash", str(update_script)],
-            cwd=project_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+    # Update flag atomi létrehozása: két párhuzamos kérés közül csak az egyik nyerhet
+    if not try_acquire_update_flag():
+        return JSONResponse(
+            status_code=400,
+            content={"error": "Update már folyamatban van"}
         )
+    
+    try:
+        # Update script futtatása háttérben (az indítás worker szálon, hogy ne blokkolja az event loopot)
+        # A script végén automatikusan törli a flagot.
+        log_path = await asyncio.to_thread(_spawn_update_script)
+        # A log útvonala csak a szerver kimenetébe kerül, a (hitelesítés nélküli) státusz végpontba nem
+        print(f"[UPDATE] update.sh kimenete: {log_path}")
         
         return JSONResponse(content={
             "success": True,
@@ -171,22 +235,54 @@ async def execute_update(request: Request, db: Session = Depends(get_db)):
             content={"error": str(e)}
         )
 
-@router.get("/status")
-async def update_status(request: Request):
-    """Update státusz ellenőrzése"""
-    project_dir = Path(__file__).parent.parent.parent
-    
-    # Service státusz ellenőrzése
-    try:
-        result = subprocess.run(
-            ["systemctl", "is-active", "zedinarkmanager"],
-            capture_output=True,
-            text=True,
-            timeout=5
+def _spawn_update_script() -> Path:
+    """
+    update.sh indítása leválasztott folyamatként. A kimenet log fájlba megy:
+    a soha ki nem olvasott PIPE megtelne és a script megakadna. Visszaadja a log fájl útvonalát.
+    """
+    UPDATE_LOG_DIR.mkdir(exist_ok=True)
+    log_path = UPDATE_LOG_DIR / f"update-{int(time.time())}.log"
+    with open(log_path, "wb") as log_file:
+        subprocess.Popen(
+            ["bash", str(UPDATE_SCRIPT)],
+            cwd=PROJECT_DIR,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True  # a uvicorn újraindítása ne vigye magával
         )
-        service_active = result.returncode == 0
-    except:
-        service_active = False
+    return log_path
+
+def _dbus_service_active() -> bool:
+    """Service ActiveState lekérése közvetlenül a systemd D-Bus API-ján (pystemd)"""
+    with Unit(f"{SERVICE_NAME}.service".encode()) as unit:
+        return unit.Unit.ActiveState == b"active"
+
+async def _is_service_active() -> bool:
+    """A manager service aktív-e (systemctl), legfeljebb SERVICE_CHECK_INTERVAL másodpercenként lekérdezve"""
+    now = time.monotonic()
+    if now - _service_state["ts"] < SERVICE_CHECK_INTERVAL:
+        return _service_state["active"]
+    service_active = None
+    if PYSTEMD_AVAILABLE:
+        try:
+            service_active = await asyncio.to_thread(_dbus_service_active)
+        except Exception:
+            # Nincs elérhető D-Bus (pl. konténerben) - systemctl-re esünk vissza
+            service_active = None
+    if service_active is None:
+        try:
+            returncode, _, _ = await run_command("systemctl", "is-active", SERVICE_NAME, timeout=5)
+            service_active = returncode == 0
+        except:
+            service_active = False
+    _service_state["ts"] = now
+    _service_state["active"] = service_active
+    return service_active
+
+async def collect_update_status() -> dict:
+    """Update és service státusz összegyűjtése (a /status és a /status/stream közös része)"""
+    # Service státusz ellenőrzése
+    service_active = await _is_service_active()
     
     # Update folyamatban van?
     updating = is_update_in_progress()
@@ -196,13 +292,8 @@ async def update_status(request: Request):
         # Ellenőrizzük, hogy az update script még fut-e
         try:
             # Nézzük meg, hogy van-e update.sh folyamat
-            result = subprocess.run(
-                ["pgrep", "-f", "update.sh"],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            script_running = result.returncode == 0
+            returncode, _, _ = await run_command("pgrep", "-f", "update.sh", timeout=2)
+            script_running = returncode == 0
             if not script_running:
                 # Ha a script nem fut, de a flag még ott van, töröljük
                 set_update_in_progress(False)
@@ -213,43 +304,167 @@ async def update_status(request: Request):
                 set_update_in_progress(False)
                 updating = False
     
-    return JSONResponse(content={
+    return {
         "service_active": service_active,
         "updating": updating
-    })
+    }
 
-def get_git_info(project_dir: Path) -> dict:
-    """Git információk lekérése"""
+@router.get("/status")
+async def update_status(request: Request):
+    """Update státusz ellenőrzése"""
+    return JSONResponse(content=await collect_update_status())
+
+@router.get("/status/stream")
+async def update_status_stream(request: Request):
+    """
+    Update státusz Server-Sent Events folyamként: csak állapotváltozáskor küld eseményt,
+    így a böngészőnek nem kell másodpercenként lekérdeznie a /status-t.
+    """
+    async def event_stream():
+        last_status = None
+        while not await request.is_disconnected():
+            status = await collect_update_status()
+            if status != last_status:
+                last_status = status
+                yield f"event: state\ndata: {json.dumps(status)}\n\n"
+                if status["service_active"] and not status["updating"]:
+                    break  # Kész, a kliens átirányít
+            await asyncio.sleep(STATUS_STREAM_INTERVAL)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _git_info_cache_key():
+    """Gyorsítótár kulcs a git metaadat fájlok módosítási idejéből (None, ha nem elérhető)"""
     try:
-        # Jelenlegi branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=5
+        return (
+            os.stat(_GIT_HEAD_FILE).st_mtime_ns,
+            os.stat(_GIT_LOGS_HEAD_FILE).st_mtime_ns
         )
-        current_branch = result.stdout.strip() if result.returncode == 0 else "unknown"
+    except OSError:
+        return None
+
+async def get_git_info() -> dict:
+    """Git információk lekérése (gyorsítótárból, ha a HEAD azóta nem változott)"""
+    key = _git_info_cache_key()
+    if key is not None and key == _git_info_cache["key"]:
+        return _git_info_cache["value"]
+    
+    git_info = await _read_git_info()
+    if key is not None and git_info["commit"] != "unknown":
+        _git_info_cache["key"] = key
+        _git_info_cache["value"] = git_info
+    return git_info
+
+def _resolve_ref(git_dir: Path, ref: str) -> str | None:
+    """Ref feloldása teljes SHA-ra: előbb a loose ref fájl, utána a packed-refs"""
+    ref_file = git_dir / ref
+    if ref_file.is_file():
+        return ref_file.read_text().strip()
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[1] == ref:
+                return parts[0]
+    return None
+
+def _read_commit_date(git_dir: Path, sha: str) -> str | None:
+    """
+    Commit dátum (committer idő, a committer időzónájában, YYYY-MM-DD) a loose objektumból.
+    Packfile-ban lévő commit esetén None (ilyenkor a git parancsra esünk vissza).
+    """
+    object_file = git_dir / "objects" / sha[:2] / sha[2:]
+    if not object_file.is_file():
+        return None
+    data = zlib.decompress(object_file.read_bytes())
+    for line in data.split(b"\n"):
+        if not line:
+            break  # a fejléc után az üzenet következik
+        if line.startswith(b"committer "):
+            timestamp, offset = line.rsplit(b" ", 2)[1:]
+            sign = -1 if offset.startswith(b"-") else 1
+            tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5])))
+            return datetime.fromtimestamp(int(timestamp), tz).date().isoformat()
+    return None
+
+def _read_head() -> tuple[str, str | None]:
+    """HEAD kiolvasása a .git könyvtárból: (branch, teljes SHA). Detached HEAD esetén a branch "HEAD"."""
+    head = _GIT_HEAD_FILE.read_text().strip()
+    if head.startswith("ref: "):
+        ref = head[len("ref: "):]
+        current_branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        return current_branch, _resolve_ref(GIT_DIR, ref)
+    return "HEAD", head
+
+def _read_git_info_from_files() -> dict | None:
+    """
+    Git információk kiolvasása közvetlenül a .git könyvtárból, git folyamat indítása nélkül.
+    None, ha valami nem olvasható így (pl. worktree, packfile-ban lévő commit).
+    """
+    try:
+        current_branch, sha = _read_head()
+        if not sha:
+            return None
         
-        # Jelenlegi commit
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        current_commit = result.stdout.strip() if result.returncode == 0 else "unknown"
+        last_commit_date = _read_commit_date(GIT_DIR, sha)
+        if last_commit_date is None:
+            return None
         
-        # Utolsó commit dátum
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%cd", "--date=short"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
+        return {
+            "branch": current_branch,
+            "commit": sha[:7],
+            "last_commit_date": last_commit_date
+        }
+    except (OSError, ValueError, zlib.error):
+        return None
+
+def _read_git_info_pygit2() -> dict | None:
+    """Git információk pygit2-vel, a modul szinten megnyitott repository-ból (None, ha nem sikerül)"""
+    global _pygit2_repo
+    try:
+        if _pygit2_repo is None:
+            _pygit2_repo = pygit2.Repository(str(PROJECT_DIR))
+        repo = _pygit2_repo
+        commit = repo[repo.head.target]
+        tz = timezone(timedelta(minutes=commit.commit_time_offset))
+        return {
+            "branch": "HEAD" if repo.head_is_detached else repo.head.shorthand,
+            "commit": str(commit.id)[:7],
+            "last_commit_date": datetime.fromtimestamp(commit.commit_time, tz).date().isoformat()
+        }
+    except Exception:
+        return None
+
+async def _read_git_info() -> dict:
+    """Git információk lekérése: .git fájlokból, pygit2-vel, vagy egyetlen git hívással"""
+    git_info = _read_git_info_from_files()
+    if git_info is None and PYGIT2_AVAILABLE:
+        git_info = _read_git_info_pygit2()
+    if git_info is not None:
+        return git_info
+    
+    try:
+        returncode, stdout, stderr = await run_command(
+            "git", "log", "-1", "--format=%h%x00%cd%x00%D", "--date=short", "HEAD",
+            cwd=PROJECT_DIR,
             timeout=5
         )
-        last_commit_date = result.stdout.strip() if result.returncode == 0 else "unknown"
+        if returncode != 0:
+            raise RuntimeError(stderr.strip())
+        
+        current_commit, last_commit_date, refs = stdout.strip().split("\x00")
+        
+        # A ref nevek formátuma pl. "HEAD -> main, origin/main"; detached HEAD esetén nincs "->"
+        current_branch = "HEAD"
+        for ref in refs.split(","):
+            ref = ref.strip()
+            if ref.startswith("HEAD -> "):
+                current_branch = ref[len("HEAD -> "):]
+                break
         
         return {
             "branch": current_branch,
@@ -264,33 +479,50 @@ def get_git_info(project_dir: Path) -> dict:
         }
 
 def is_update_in_progress() -> bool:
-    """Update folyamatban van-e?"""
-    project_dir = Path(__file__).parent.parent.parent
-    flag_file = project_dir / ".updating"
-    return flag_file.exists()
+    """Update folyamatban van-e? (a flag fájl állapotát FLAG_CHECK_INTERVAL-ig gyorsítótárazzuk)"""
+    now = time.monotonic()
+    if now - _update_flag_state["ts"] >= FLAG_CHECK_INTERVAL:
+        try:
+            os.stat(UPDATE_FLAG_FILE)
+            _update_flag_state["value"] = True
+        except FileNotFoundError:
+            _update_flag_state["value"] = False
+        _update_flag_state["ts"] = now
+    return _update_flag_state["value"]
+
+def try_acquire_update_flag() -> bool:
+    """
+    Update flag létrehozása O_CREAT|O_EXCL-lel. False, ha a flag már létezik
+    (egy másik kérés vagy update épp megszerezte).
+    """
+    try:
+        fd = os.open(UPDATE_FLAG_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        _update_flag_state["value"] = True
+        _update_flag_state["ts"] = time.monotonic()
+        return False
+    try:
+        os.write(fd, f"{os.getpid()}\n{int(time.time())}\n".encode())
+    finally:
+        os.close(fd)
+    _update_flag_state["value"] = True
+    _update_flag_state["ts"] = time.monotonic()
+    return True
 
 def set_update_in_progress(value: bool):
     """Update flag beállítása"""
-    project_dir = Path(__file__).parent.parent.parent
-    flag_file = project_dir / ".updating"
-    
     if value:
-        flag_file.touch()
+        UPDATE_FLAG_FILE.touch()
     else:
-        if flag_file.exists():
-            flag_file.unlink()
+        UPDATE_FLAG_FILE.unlink(missing_ok=True)
+    
+    # A gyorsítótárazott állapot azonnal kövesse a saját módosításunkat
+    _update_flag_state["value"] = value
+    _update_flag_state["ts"] = time.monotonic()
 
 @router.post("/clear-flag")
-async def clear_update_flag(request: Request, db: Session = Depends(get_db)):
+async def clear_update_flag(request: Request, current_user = Depends(require_manager_admin_session)):
     """Update flag manuális törlése"""
-    # Manager Admin ellenőrzés
-    try:
-        require_manager_admin(request, db)
-    except HTTPException as e:
-        if e.status_code == 302:
-            raise HTTPException(status_code=401, detail="Nincs bejelentkezve")
-        raise HTTPException(status_code=403, detail="Nincs jogosultság")
-    
     try:
         set_update_in_progress(False)
         return JSONResponse(content={
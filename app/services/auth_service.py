@@ -2,6 +2,7 @@
 Autentikációs szolgáltatás
 """
 
+import bcrypt
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 from jose import jwt
@@ -32,14 +33,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     try:
         if pwd_context is None:
-            # Közvetlenül bcrypt használata
-            import bcrypt
+            # Közvetlenül bcrypt használata (konstans idejű összehasonlítás)
             return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
         return pwd_context.verify(plain_password, hashed_password)
     except (ValueError, TypeError, AttributeError) as e:
         # Ha a hash formátuma nem megfelelő, próbáljuk meg közvetlenül bcrypt-tel
         try:
-            import bcrypt
             return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
         except Exception as e2:
             print(f"Password verification error: {e}, bcrypt fallback error: {e2}")
@@ -65,14 +64,12 @@ def get_password_hash(password: str) -> str:
     try:
         if pwd_context is None:
             # Közvetlenül bcrypt használata
-            import bcrypt
             salt = bcrypt.gensalt()
             return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
         return pwd_context.hash(password)
     except (ValueError, AttributeError, TypeError) as e:
         # Ha még mindig probléma van, próbáljuk meg közvetlenül bcrypt-tel
         try:
-            import bcrypt
             salt = bcrypt.gensalt()
             return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
         except Exception as e2:
@@ -129,6 +126,10 @@ def create_user(
     db.commit()
     db.refresh(user)
     
+    # Az új felhasználónak azonnal meg kell jelennie a token generálás listájában
+    from app.services.token_service import invalidate_assignable_users
+    invalidate_assignable_users()
+    
     return user
 
 def verify_email_token(db: Session, token: str) -> User | None:
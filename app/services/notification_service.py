@@ -2,6 +2,7 @@
 Értesítési szolgáltatás
 """
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.database import Notification
 
@@ -26,6 +27,30 @@ def create_notification(
     
     return notification
 
+def create_notifications_bulk(
+    db: Session,
+    user_ids: list[int],
+    notification_type: str,
+    title: str,
+    message: str
+) -> int:
+    """Ugyanaz az értesítés több felhasználónak, egyetlen INSERT-tel"""
+    if not user_ids:
+        return 0
+    
+    db.execute(insert(Notification), [
+        {
+            "user_id": user_id,
+            "type": notification_type,
+            "title": title,
+            "message": message
+        }
+        for user_id in user_ids
+    ])
+    db.commit()
+    
+    return len(user_ids)
+
 def get_user_notifications(
     db: Session,
     user_id: int,
@@ -2,12 +2,47 @@
 Token szolgáltatás
 """
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from app.database import Token, User, TokenType, UserRole
+from app.database import SessionLocal, Token, User, TokenType, UserRole
 from app.config import settings
 import secrets
+import os
+import base64
+import threading
+import time
 from app.services.email_service import send_token_notification
+from app.dependencies import invalidate_session_user
+
+# Token generálás űrlap felhasználó listájának gyorsítótára: (betöltés ideje, sorok)
+ASSIGNABLE_USERS_TTL = 30  # másodperc
+_assignable_users_cache = None
+_assignable_users_lock = threading.Lock()
+
+def get_assignable_users(db: Session) -> list:
+    """
+    Tokennel ellátható felhasználók (user és server_admin) listája, rövid TTL-es gyorsítótárral.
+    Csak a legördülő listához szükséges oszlopokat tölti be (Row tuple-ök).
+    """
+    global _assignable_users_cache
+    now = time.monotonic()
+    cached = _assignable_users_cache
+    if cached and now - cached[0] < ASSIGNABLE_USERS_TTL:
+        return cached[1]
+    
+    rows = db.query(User.id, User.username, User.email, User.role).filter(
+        User.role.in_([UserRole.USER, UserRole.SERVER_ADMIN])
+    ).order_by(User.username).all()
+    with _assignable_users_lock:
+        _assignable_users_cache = (now, rows)
+    return rows
+
+def invalidate_assignable_users() -> None:
+    """Felhasználó lista gyorsítótár törlése (rang, név/email változás vagy törlés esetén)"""
+    global _assignable_users_cache
+    with _assignable_users_lock:
+        _assignable_users_cache = None
 
 def generate_token(
     db: Session,
@@ -35,6 +70,57 @@ def generate_token(
     
     return token
 
+def insert_tokens(
+    db: Session,
+    generated_by_id: int,
+    token_type: TokenType,
+    count: int,
+    expires_in_days: int | None = None,
+    user_id: int | None = None
+) -> list[str]:
+    """
+    Több token beszúrása egyetlen (executemany) INSERT-tel, commit nélkül.
+    Ha user_id meg van adva, a tokenek már aktiválva, a felhasználóhoz rendelve kerülnek be.
+    Visszaadja a generált token stringeket.
+    """
+    if expires_in_days is None:
+        expires_in_days = settings.token_expiry_days
+    
+    # Egyetlen os.urandom hívás az összes tokenhez, 32 bájtos szeletekre bontva
+    # (ugyanaz a formátum, mint a secrets.token_urlsafe(32))
+    raw = os.urandom(32 * count)
+    token_strings = [
+        base64.urlsafe_b64encode(raw[i:i + 32]).rstrip(b"=").decode("ascii")
+        for i in range(0, 32 * count, 32)
+    ]
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=expires_in_days)
+    
+    row = {
+        "token_type": token_type,
+        "generated_by_id": generated_by_id,
+        "expires_at": expires_at
+    }
+    if user_id is not None:
+        row.update(user_id=user_id, is_active=True, activated_at=now)
+    
+    db.execute(insert(Token), [{**row, "token": token_string} for token_string in token_strings])
+    return token_strings
+
+def generate_tokens_bulk(
+    db: Session,
+    generated_by_id: int,
+    token_type: TokenType,
+    count: int,
+    expires_in_days: int | None = None
+) -> list[Token]:
+    """Több token generálása egyetlen (executemany) INSERT-tel és egy commit-tal"""
+    token_strings = insert_tokens(db, generated_by_id, token_type, count, expires_in_days)
+    db.commit()
+    
+    # MySQL nem támogatja a RETURNING-et, ezért egy lekérdezéssel töltjük vissza az új sorokat
+    return db.query(Token).filter(Token.token.in_(token_strings)).order_by(Token.id).all()
+
 async def activate_token(db: Session, token_string: str, user_id: int) -> dict:
     """Token aktiválása"""
     token = db.query(Token).filter(
@@ -68,6 +154,8 @@ async def activate_token(db: Session, token_string: str, user_id: int) -> dict:
                     user.role = UserRole.SERVER_ADMIN
                     db.commit()
                     db.refresh(user)
+                invalidate_session_user(user_id)
+                invalidate_assignable_users()
     
     db.commit()
     
@@ -102,6 +190,39 @@ async def send_token_to_user(db: Session, token: Token, user_id: int) -> bool:
     
     return email_sent
 
+async def send_token_to_user_background(token_id: int, user_id: int, notify_user_id: int | None = None) -> None:
+    """
+    Token küldése háttérfeladatként, saját adatbázis session-nel.
+    Ha az email küldése nem sikerül, a notify_user_id felhasználó (a generáló admin) értesítést kap.
+    """
+    db = SessionLocal()
+    email_sent = False
+    try:
+        token = db.get(Token, token_id)
+        if token:
+            email_sent = await send_token_to_user(db, token, user_id)
+    except Exception as e:
+        print(f"Token küldési hiba (háttérfeladat): {e}")
+    
+    try:
+        if not email_sent and notify_user_id is not None:
+            from app.services.notification_service import create_notification
+            db.rollback()
+            target = db.get(User, user_id)
+            target_name = target.username if target else f"#{user_id}"
+            create_notification(
+                db,
+                notify_user_id,
+                "token_email_failed",
+                "Token email küldése sikertelen",
+                f"A(z) {target_name} felhasználónak generált token email-ben nem lett kiküldve. "
+                f"Ellenőrizd az SMTP beállításokat, és szükség esetén küldd el a tokent kézzel."
+            )
+    except Exception as e:
+        print(f"Token küldési hiba értesítése sikertelen: {e}")
+    finally:
+        db.close()
+
 async def check_expiring_tokens(db: Session) -> int:
     """Lejáró tokenek ellenőrzése és értesítés küldése"""
     from app.services.notification_service import create_notification
@@ -0,0 +1,24 @@
+"""
+Közös template példány és projekt útvonal
+Routerek nélküli modul, így a routerek körkörös import nélkül használhatják (app.main a routereket importálja)
+"""
+
+from pathlib import Path
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from jinja2.utils import LRUCache
+from app.config import settings
+
+# Projekt gyökér
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Template-ek - egyetlen közös példány (TEMPLATES)
+TEMPLATES_DIR = BASE_DIR / "templates"
+if not TEMPLATES_DIR.exists():
+    TEMPLATES_DIR.mkdir(exist_ok=True)
+TEMPLATES = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# Élesben nem ellenőrizzük minden rendereléskor a template fájlok módosítását,
+# a lefordított template-eket pedig bytecode cache-ben tartjuk
+TEMPLATES.env.auto_reload = settings.debug
+TEMPLATES.env.cache = LRUCache(400)
+TEMPLATES.env.bytecode_cache = FileSystemBytecodeCache()